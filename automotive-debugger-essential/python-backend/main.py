@@ -32,7 +32,7 @@ from analyzers.timeline_builder import TimelineBuilder
 from ai.ollama_manager import OllamaManager
 from ai.nlp_engine import NLPEngine
 from database.models import init_database, get_session, UploadedFile, AnalysisSession, FileStatus
-from utils.file_utils import save_uploaded_file, get_file_hash
+from utils.file_utils import save_uploaded_file
 
 # Configure logging
 logging.basicConfig(
@@ -156,8 +156,7 @@ async def upload_files(files: List[UploadFile] = File(...)):
     for file in files:
         try:
             # Save file
-            file_path = await save_uploaded_file(file)
-            file_hash = get_file_hash(file_path)
+            file_path, file_hash = await save_uploaded_file(file)
 
             # Auto-detect format
             detected_format = auto_detector.detect_format(file_path)
@@ -381,10 +380,9 @@ async def export_analysis(request: ExportRequest):
         elif request.format == "csv":
             from utils.csv_exporter import CSVExporter
             exporter = CSVExporter()
-            csv_content = await exporter.export(analysis, request.include_sections)
             
             return StreamingResponse(
-                io.BytesIO(csv_content.encode()),
+                exporter.export_stream(analysis, request.include_sections),
                 media_type="text/csv",
                 headers={
                     "Content-Disposition": f"attachment; filename=analysis_{request.analysis_id}.csv"
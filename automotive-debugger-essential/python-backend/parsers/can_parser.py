@@ -4,7 +4,10 @@ Parses various CAN log formats including Linux SocketCAN format
 """
 
 import re
+import heapq
 import struct
+import platform
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple, Generator
 from dataclasses import dataclass
@@ -13,7 +16,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# PyPy's tracing JIT compiles plain index loops far better than it runs re
+_IS_PYPY = platform.python_implementation() == 'PyPy'
+_DIGITS = frozenset('0123456789')
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+@dataclass(slots=True)
 class CANMessage:
     """Represents a single CAN message"""
     timestamp: float
@@ -80,6 +88,19 @@ class CANParser:
         
         self.current_format = None
         self.statistics = {}
+        
+        # Format-specific line parsers, tried in this order by parse_line.
+        # Once validate_format has detected the format, parse_file calls the
+        # matching entry directly instead of walking the whole fallback chain.
+        self._parsers = {
+            'socketcan': self._parse_socketcan,
+            'j1939': self._parse_j1939,
+            'asc': self._parse_asc,
+            'simple': self._parse_simple
+        }
+        
+        if _IS_PYPY:
+            self._parsers['socketcan'] = self._parse_socketcan_scan
     
     def validate_format(self, file_path: Path) -> bool:
         """
@@ -105,9 +126,31 @@ class CANParser:
             logger.error(f"Error validating CAN format: {e}")
             return False
     
-    def parse_file(self, file_path: str, chunk_size: int = 10000) -> Generator[List[CANMessage], None, None]:
+    def parse_file(self, file_path: str, chunk_size: int = 10000,
+                   keep_raw: bool = False) -> Generator[List[CANMessage], None, None]:
         """
         Parse CAN log file in chunks for memory efficiency
+        
+        raw_line is only retained when keep_raw is True (debug views); bulk
+        parsing leaves it empty so chunks don't hold a copy of every line.
+        """
+        messages_buffer = []
+        
+        for message in self._iter_messages(file_path, keep_raw):
+            messages_buffer.append(message)
+            
+            # Yield chunk when buffer is full
+            if len(messages_buffer) >= chunk_size:
+                yield messages_buffer
+                messages_buffer = []
+        
+        # Yield remaining messages
+        if messages_buffer:
+            yield messages_buffer
+    
+    def _iter_messages(self, file_path: str, keep_raw: bool = False) -> Generator[CANMessage, None, None]:
+        """
+        Yield CAN messages one at a time in a single pass over the file
         """
         file_path = Path(file_path)
         
@@ -118,7 +161,10 @@ class CANParser:
         if not self.current_format:
             self.validate_format(file_path)
         
-        messages_buffer = []
+        # Fast path for the detected format, generic parse_line otherwise
+        fast_parse = self._parsers.get(self.current_format)
+        parse_line = fast_parse or self.parse_line
+        
         line_count = 0
         error_count = 0
         
@@ -136,23 +182,18 @@ class CANParser:
                         continue
                     
                     try:
-                        message = self.parse_line(line)
-                        if message:
-                            messages_buffer.append(message)
-                            
-                            # Yield chunk when buffer is full
-                            if len(messages_buffer) >= chunk_size:
-                                yield messages_buffer
-                                messages_buffer = []
-                                
+                        message = parse_line(line, keep_raw)
+                        if message is None and fast_parse is not None:
+                            # Heterogeneous file: fall back to trying every format
+                            message = self.parse_line(line, keep_raw)
                     except Exception as e:
                         error_count += 1
                         if error_count < 10:  # Log first 10 errors
                             logger.debug(f"Error parsing line {line_count}: {e}")
-                
-                # Yield remaining messages
-                if messages_buffer:
-                    yield messages_buffer
+                        continue
+                    
+                    if message:
+                        yield message
                     
         except Exception as e:
             logger.error(f"Error reading file: {e}")
@@ -160,69 +201,154 @@ class CANParser:
         
         logger.info(f"Parsed {line_count} lines with {error_count} errors")
     
-    def parse_line(self, line: str) -> Optional[CANMessage]:
+    def parse_line(self, line: str, keep_raw: bool = False) -> Optional[CANMessage]:
         """
         Parse a single line of CAN log
         """
-        # Try SocketCAN format first (most common in sample)
+        # SocketCAN first (most common in sample), then J1939 and the others
+        for parse in self._parsers.values():
+            message = parse(line, keep_raw)
+            if message:
+                return message
+        
+        return None
+    
+    def _parse_socketcan(self, line: str, keep_raw: bool = False) -> Optional[CANMessage]:
+        """Parse a Linux SocketCAN line"""
         match = self.patterns['socketcan'].match(line)
-        if match:
-            timestamp = float(match.group(1))
-            channel = match.group(2)
-            can_id_str = match.group(3)
-            data_str = match.group(4)
-            
-            # Parse CAN ID
-            can_id = int(can_id_str, 16)
-            is_extended = len(can_id_str) > 3  # Extended if more than 11 bits
-            
-            # Parse data
-            data_bytes = bytes.fromhex(data_str) if data_str else b''
-            
-            return CANMessage(
-                timestamp=timestamp,
-                channel=channel,
-                can_id=can_id,
-                is_extended=is_extended,
-                is_error=False,
-                is_remote=False,
-                dlc=len(data_bytes),
-                data=data_bytes,
-                raw_line=line
-            )
+        if not match:
+            return None
+        
+        timestamp = float(match.group(1))
+        channel = match.group(2)
+        can_id_str = match.group(3)
+        data_str = match.group(4)
         
-        # Try J1939 format
+        # Parse CAN ID
+        can_id = int(can_id_str, 16)
+        is_extended = len(can_id_str) > 3  # Extended if more than 11 bits
+        
+        # Parse data
+        data_bytes = bytes.fromhex(data_str) if data_str else b''
+        
+        return CANMessage(
+            timestamp=timestamp,
+            channel=channel,
+            can_id=can_id,
+            is_extended=is_extended,
+            is_error=False,
+            is_remote=False,
+            dlc=len(data_bytes),
+            data=data_bytes,
+            raw_line=line if keep_raw else ""
+        )
+    
+    def _parse_socketcan_scan(self, line: str, keep_raw: bool = False) -> Optional[CANMessage]:
+        """
+        Parse a Linux SocketCAN line with a hand-rolled scanner
+        
+        Accepts exactly what the 'socketcan' regex matches. Written as a plain
+        index loop (no regex, keyword arguments or f-strings) so PyPy's JIT can
+        specialise it; CPython keeps using the regex version.
+        """
+        n = len(line)
+        if n == 0 or line[0] != '(':
+            return None
+        
+        # Timestamp: digits '.' digits ')'
+        i = 1
+        while i < n and line[i] in _DIGITS:
+            i += 1
+        if i == 1 or i >= n or line[i] != '.':
+            return None
+        i += 1
+        frac_start = i
+        while i < n and line[i] in _DIGITS:
+            i += 1
+        if i == frac_start or i >= n or line[i] != ')':
+            return None
+        timestamp = float(line[1:i])
+        i += 1
+        
+        # Whitespace, then channel name (\w+)
+        ws_start = i
+        while i < n and line[i].isspace():
+            i += 1
+        if i == ws_start:
+            return None
+        chan_start = i
+        while i < n and (line[i].isalnum() or line[i] == '_'):
+            i += 1
+        if i == chan_start:
+            return None
+        channel = line[chan_start:i]
+        
+        # Whitespace, then hex CAN ID terminated by '#'
+        ws_start = i
+        while i < n and line[i].isspace():
+            i += 1
+        if i == ws_start:
+            return None
+        id_start = i
+        while i < n and line[i] in _HEX_DIGITS:
+            i += 1
+        if i == id_start or i >= n or line[i] != '#':
+            return None
+        can_id_str = line[id_start:i]
+        i += 1
+        
+        # Optional hex payload
+        data_start = i
+        while i < n and line[i] in _HEX_DIGITS:
+            i += 1
+        data_bytes = bytes.fromhex(line[data_start:i]) if i > data_start else b''
+        
+        return CANMessage(
+            timestamp,
+            channel,
+            int(can_id_str, 16),
+            len(can_id_str) > 3,
+            False,
+            False,
+            len(data_bytes),
+            data_bytes,
+            line if keep_raw else ""
+        )
+    
+    def _parse_j1939(self, line: str, keep_raw: bool = False) -> Optional[CANMessage]:
+        """Parse a J1939 (extended CAN) line"""
         match = self.patterns['j1939'].match(line)
-        if match:
-            timestamp = float(match.group(1))
-            channel = match.group(2)
-            can_id = int(match.group(3), 16)
-            data_str = match.group(4)
-            
-            data_bytes = bytes.fromhex(data_str) if data_str else b''
-            
-            return CANMessage(
-                timestamp=timestamp,
-                channel=channel,
-                can_id=can_id,
-                is_extended=True,  # J1939 always uses extended IDs
-                is_error=False,
-                is_remote=False,
-                dlc=len(data_bytes),
-                data=data_bytes,
-                raw_line=line
-            )
+        if not match:
+            return None
         
-        # Try other formats
-        for format_name, pattern in self.patterns.items():
-            if format_name in ['socketcan', 'j1939']:
-                continue
-                
-            match = pattern.match(line)
-            if match:
-                return self._parse_format_specific(format_name, match, line)
+        timestamp = float(match.group(1))
+        channel = match.group(2)
+        can_id = int(match.group(3), 16)
+        data_str = match.group(4)
         
-        return None
+        data_bytes = bytes.fromhex(data_str) if data_str else b''
+        
+        return CANMessage(
+            timestamp=timestamp,
+            channel=channel,
+            can_id=can_id,
+            is_extended=True,  # J1939 always uses extended IDs
+            is_error=False,
+            is_remote=False,
+            dlc=len(data_bytes),
+            data=data_bytes,
+            raw_line=line if keep_raw else ""
+        )
+    
+    def _parse_asc(self, line: str, keep_raw: bool = False) -> Optional[CANMessage]:
+        """Parse a CANalyzer ASC line"""
+        match = self.patterns['asc'].match(line)
+        return self._parse_format_specific('asc', match, line if keep_raw else "") if match else None
+    
+    def _parse_simple(self, line: str, keep_raw: bool = False) -> Optional[CANMessage]:
+        """Parse a simple timestamp,id,dlc,data line"""
+        match = self.patterns['simple'].match(line)
+        return self._parse_format_specific('simple', match, line if keep_raw else "") if match else None
     
     def _parse_format_specific(self, format_name: str, match, line: str) -> Optional[CANMessage]:
         """
@@ -296,37 +422,41 @@ class CANParser:
         first_timestamp = None
         last_timestamp = None
         
-        for chunk in self.parse_file(file_path, chunk_size=10000):
-            for msg in chunk:
-                stats['total_messages'] += 1
-                stats['unique_ids'].add(msg.can_id)
-                stats['channels'].add(msg.channel)
-                
-                # Track timestamps
-                if first_timestamp is None:
-                    first_timestamp = msg.timestamp
-                last_timestamp = msg.timestamp
-                
-                # Track ID types
-                if msg.is_extended:
-                    stats['extended_ids'] += 1
-                else:
-                    stats['standard_ids'] += 1
-                
-                # Track errors
-                if msg.is_error:
-                    stats['error_frames'] += 1
-                
-                # ID frequency
-                id_hex = f"{msg.can_id:08X}"
-                stats['id_frequency'][id_hex] = stats['id_frequency'].get(id_hex, 0) + 1
-                
-                # DLC distribution
-                stats['dlc_distribution'][msg.dlc] = stats['dlc_distribution'].get(msg.dlc, 0) + 1
+        # Accumulate into locals while streaming messages straight off the
+        # parser, so no chunk lists are built and the file is scanned once
+        channels = set()
+        id_counts = {}
+        dlc_counts = {}
+        total = 0
+        extended = 0
+        errors = 0
+        
+        for msg in self._iter_messages(file_path):
+            total += 1
+            can_id = msg.can_id
+            channels.add(msg.channel)
+            
+            # Track timestamps
+            if first_timestamp is None:
+                first_timestamp = msg.timestamp
+            last_timestamp = msg.timestamp
+            
+            # Track ID types and errors
+            extended += msg.is_extended
+            errors += msg.is_error
+            
+            # ID frequency and DLC distribution
+            id_counts[can_id] = id_counts.get(can_id, 0) + 1
+            dlc_counts[msg.dlc] = dlc_counts.get(msg.dlc, 0) + 1
         
-        # Convert sets to lists for JSON serialization
-        stats['unique_ids'] = len(stats['unique_ids'])
-        stats['channels'] = list(stats['channels'])
+        stats['total_messages'] = total
+        stats['unique_ids'] = len(id_counts)
+        stats['channels'] = list(channels)
+        stats['extended_ids'] = extended
+        stats['standard_ids'] = total - extended
+        stats['error_frames'] = errors
+        stats['id_frequency'] = {f"{can_id:08X}": count for can_id, count in id_counts.items()}
+        stats['dlc_distribution'] = dlc_counts
         
         # Calculate time range and message rate
         if first_timestamp and last_timestamp:
@@ -336,12 +466,12 @@ class CANParser:
             if duration > 0:
                 stats['message_rate'] = stats['total_messages'] / duration
         
-        # Get top IDs
-        stats['top_ids'] = sorted(
+        # Get top IDs (bounded heap instead of sorting every unique ID)
+        stats['top_ids'] = heapq.nlargest(
+            10,
             stats['id_frequency'].items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:10]
+            key=itemgetter(1)
+        )
         
         return stats
     
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class CANalyzerMessage:
     """Represents a single CANalyzer message"""
     timestamp: float
@@ -4,15 +4,97 @@ Parses DBC (Database CAN) files for signal decoding
 """
 
 import re
+import sys
+import copy
+import functools
+import threading
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from contextlib import contextmanager
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 import logging
 import cantools
+from cantools.database.can import message as cantools_message
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+try:
+    from numba import njit
+except ImportError:  # numba is optional (no wheels for every Python yet)
+    njit = None
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+def _extract_bits(buf, start_bit: int, size: int, little_endian: bool) -> int:
+    """
+    Extract the raw unsigned value of a signal from CAN payload bytes
+    
+    Works on bytes or a uint8 array; bits outside the payload read as 0.
+    Kept free of Python-only constructs so numba can compile it as-is.
+    """
+    value = 0
+    n = len(buf)
+    
+    if little_endian:
+        # Intel byte order
+        for i in range(size):
+            bit_position = start_bit + i
+            byte_index = bit_position // 8
+            
+            if byte_index < n:
+                value |= ((buf[byte_index] >> (bit_position % 8)) & 1) << i
+    else:
+        # Motorola byte order
+        for i in range(size):
+            bit_position = start_bit - i
+            byte_index = bit_position // 8
+            
+            if 0 <= byte_index < n:
+                value |= ((buf[byte_index] >> (7 - bit_position % 8)) & 1) << (size - 1 - i)
+    
+    return value
+
+# Native version of the bit loop; int64 arithmetic limits it to < 64-bit signals
+_extract_bits_native = njit(cache=True, boundscheck=False)(_extract_bits) if njit else None
+
+# Linear-time RE2 engine when installed; the patterns below avoid features it
+# lacks so they compile under either engine
+try:
+    import re2 as _dbc_re
+except ImportError:
+    _dbc_re = re
+
+# Manual-parse patterns, compiled once and matched against stripped lines
+_BU_RE = _dbc_re.compile(r'BU_\s*:?\s*(.*)')
+_BO_RE = _dbc_re.compile(r'BO_\s+(\d+)\s+(\w+):\s+(\d+)\s+(\w+)')
+_BO_ID_RE = _dbc_re.compile(r'BO_\s+(\d+)')
+_SG_RE = _dbc_re.compile(
+    r'SG_\s+(\w+)\s*(?:(\w+)\s*)?:\s*(\d+)\|(\d+)@(\d+)([\+\-])\s*\(([^,)]+),([^)]+)\)\s*\[([^|\]]+)\|([^\]]+)\]\s*"([^"]*)"\s*(.*)'
+)
+_BA_DEF_RE = _dbc_re.compile(r'BA_DEF_\s+(\w+)?\s*"([^"]+)"\s+(\w+)')
+_BA_RE = _dbc_re.compile(r'BA_\s+"([^"]+)"\s+(.*);')
+_VAL_RE = _dbc_re.compile(r'VAL_\s+(\d+)\s+(\w+)\s+((?:\d+\s+"[^"]+"\s*)+);')
+_VAL_PAIR_RE = _dbc_re.compile(r'(\d+)\s+"([^"]+)"')
+# Line classifier: leading keyword of the definitions the parser handles,
+# followed by whitespace or the ':' of "BU_:". Called once per line, so it
+# stays on stdlib re (lower per-call overhead)
+_KEYWORD_RE = re.compile(r'\s*(BU_|BO_|SG_|BA_DEF_|BA_|VAL_)(?=[\s:]|$)')
+
+# Reverses the bit order of each byte. After this translation a Motorola
+# signal occupies a contiguous bit range of the little-endian payload word.
+_BIT_REVERSE = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+_BIT_REVERSE_TABLE = np.frombuffer(_BIT_REVERSE, dtype=np.uint8) if np is not None else None
+
+@dataclass(slots=True)
 class Signal:
     """Represents a CAN signal"""
     name: str
@@ -28,13 +110,21 @@ class Signal:
     receivers: List[str] = field(default_factory=list)
     multiplexer_id: Optional[int] = None
     is_multiplexer: bool = False
+    # Precomputed for _decode_signal: sign bit (0 when unsigned) and whether
+    # the physical value is clamped to [minimum, maximum]
+    _sign_mask: int = field(default=0, init=False, repr=False, compare=False)
+    _clamp: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._sign_mask = (1 << (self.size - 1)) if self.is_signed and self.size > 0 else 0
+        self._clamp = self.minimum != 0 or self.maximum != 0
     
     def decode(self, data: bytes) -> float:
         """Decode signal value from CAN data"""
         # Implementation depends on bit ordering and signal properties
         pass
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Represents a CAN message definition"""
     id: int
@@ -45,12 +135,122 @@ class Message:
     cycle_time: Optional[int] = None
     comment: Optional[str] = None
     is_extended: bool = False
+    # (name, signal, unit, value table) per signal, built once after parsing
+    _decode_cache: Optional[List[Tuple[str, 'Signal', str, Optional[Dict[int, str]]]]] = field(default=None, init=False, repr=False, compare=False)
+    _decode_plan: Optional['_DecodePlan'] = field(default=None, init=False, repr=False, compare=False)
+
+@dataclass
+class _DecodePlan:
+    """Signals of one message laid out as parallel arrays for vectorized decoding"""
+    order: List[Tuple[str, Signal, str, Optional[Dict[int, str]], int]]  # _decode_cache entry + array index (-1: scalar path)
+    motorola: Any
+    shifts: Any
+    masks: Any
+    sign_bits: Any
+    wraps: Any
+    factors: Any
+    offsets: Any
+    minimums: Any
+    maximums: Any
+    clamp: Any
+    required_bits: Any
+
+class _LazyView(Mapping):
+    """
+    Read-only mapping that builds each entry's dict on first access
+    
+    Backed by the parser's own dict, so returning it from parse_file is O(1);
+    use to_dict() where a plain (JSON-serializable) dict is required.
+    Mapping is already an ABC: subclasses must implement _build.
+    """
+    
+    def __init__(self, source: Dict[Any, Any]):
+        self._source = source
+        self._built: Dict[str, Dict[str, Any]] = {}
+    
+    def _lookup(self, key: str) -> Any:
+        return self._source[key]
+    
+    @abstractmethod
+    def _build(self, item: Any) -> Dict[str, Any]:
+        """Build the public dict for one source entry"""
+    
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        entry = self._built.get(key)
+        if entry is None:
+            entry = self._built[key] = self._build(self._lookup(key))
+        return entry
+    
+    def __contains__(self, key: object) -> bool:
+        try:
+            self._lookup(key)
+        except KeyError:
+            return False
+        return True
+    
+    def __iter__(self):
+        return (str(key) for key in self._source)
+    
+    def __len__(self) -> int:
+        return len(self._source)
+    
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {key: self[key] for key in self}
+
+class _MessagesView(_LazyView):
+    """Messages keyed by str(CAN ID), as returned by parse_file"""
+    
+    def _lookup(self, key: str) -> Message:
+        # Only the canonical decimal spelling is a key, as in the eager dict
+        if not isinstance(key, str) or not key.isdigit() or str(int(key)) != key:
+            raise KeyError(key)
+        return self._source[int(key)]
+    
+    def _build(self, msg: Message) -> Dict[str, Any]:
+        return {
+            'id': msg.id,
+            'name': msg.name,
+            'dlc': msg.dlc,
+            'sender': msg.sender,
+            'is_extended': msg.is_extended,
+            'cycle_time': msg.cycle_time,
+            'comment': msg.comment,
+            'signals': list(msg.signals.keys())
+        }
+
+class _SignalsView(_LazyView):
+    """Signals keyed by "<message>.<signal>", as returned by parse_file"""
+    
+    def _build(self, sig: Signal) -> Dict[str, Any]:
+        return {
+            'name': sig.name,
+            'start_bit': sig.start_bit,
+            'size': sig.size,
+            'is_little_endian': sig.is_little_endian,
+            'is_signed': sig.is_signed,
+            'factor': sig.factor,
+            'offset': sig.offset,
+            'minimum': sig.minimum,
+            'maximum': sig.maximum,
+            'unit': sig.unit,
+            'receivers': list(sig.receivers)
+        }
 
 class DBCParser:
     """
     Parser for DBC (CAN Database) files
     """
     
+    # Encode/decode formats built by cantools, shared by every message (in
+    # any loaded DBC) whose signal layout is identical. Kept as an LRU so a
+    # long-running server that loads many databases doesn't grow it forever.
+    _signal_cache: 'OrderedDict[Tuple, Any]' = OrderedDict()
+    _signal_cache_size = 4096
+    # Held while cantools is patched and around every cache access: FastAPI
+    # runs sync endpoints on a threadpool, so loads can overlap. Re-entrant
+    # because the patched function runs on the thread that holds it.
+    _signal_cache_lock = threading.RLock()
+    
     def __init__(self):
         self.messages: Dict[int, Message] = {}
         self.signals: Dict[str, Signal] = {}
@@ -58,27 +258,69 @@ class DBCParser:
         self.attributes: Dict[str, Any] = {}
         self.value_tables: Dict[str, Dict[int, str]] = {}
         self.db = None  # cantools database object
+        
+        # Message lookup by CAN ID: standard 11-bit IDs index a flat list,
+        # anything larger goes through a dict
+        self._msg_by_std_id: List[Optional[Message]] = [None] * 2048
+        self._msg_by_ext_id: Dict[int, Message] = {}
+        
+        # Compile the native bit extractor now rather than on the first frame
+        if _extract_bits_native is not None:
+            _extract_bits_native(np.zeros(8, dtype=np.uint8), 0, 1, True)
     
     def parse_file(self, dbc_path: str) -> Dict[str, Any]:
         """
         Parse DBC file and extract message/signal definitions
+        
+        Parsed databases are cached per (path, mtime, size), so re-opening an
+        unchanged file shares the definitions of the earlier load. The
+        cached state never leaks out mutable: messages and signals are
+        read-only mappings (the Message/Signal objects themselves are shared,
+        treat them as read-only), nodes, attributes and value tables are
+        copied, and the returned views build fresh dicts.
         """
         dbc_path = Path(dbc_path)
         
         if not dbc_path.exists():
             raise FileNotFoundError(f"DBC file not found: {dbc_path}")
         
+        stat = dbc_path.stat()
+        loaded = _load_dbc_cached(str(dbc_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        
+        self.db = loaded.db
+        self.messages = MappingProxyType(loaded.messages)
+        self.signals = MappingProxyType(loaded.signals)
+        self.nodes = list(loaded.nodes)
+        self.attributes = copy.deepcopy(loaded.attributes)
+        self.value_tables = {name: dict(table) for name, table in loaded.value_tables.items()}
+        self._msg_by_std_id = loaded._msg_by_std_id
+        self._msg_by_ext_id = loaded._msg_by_ext_id
+        
+        return {
+            'messages': _MessagesView(self.messages),
+            'signals': _SignalsView(self.signals),
+            'nodes': list(self.nodes),
+            'attributes': dict(self.attributes),
+            'value_tables': dict(self.value_tables),
+            'statistics': self.get_statistics()
+        }
+    
+    def _load(self, dbc_path: Path) -> Dict[str, Any]:
+        """
+        Load a DBC file into this parser, falling back to manual parsing
+        """
         try:
             # Use cantools for robust DBC parsing
-            self.db = cantools.database.load_file(str(dbc_path))
+            with self._shared_codec_formats():
+                self.db = cantools.database.load_file(str(dbc_path))
             
             # Extract information from cantools database
             self._extract_from_cantools()
             
             # Return parsed information
             return {
-                'messages': self._messages_to_dict(),
-                'signals': self._signals_to_dict(),
+                'messages': _MessagesView(self.messages),
+                'signals': _SignalsView(self.signals),
                 'nodes': self.nodes,
                 'attributes': self.attributes,
                 'value_tables': self.value_tables,
@@ -90,6 +332,43 @@ class DBCParser:
             # Fallback to manual parsing
             return self._manual_parse(dbc_path)
     
+    @staticmethod
+    def _signal_cache_key(sig) -> Tuple:
+        """Key on every signal property cantools' codec formats depend on"""
+        return (sig.name, sig.start, sig.length, sig.byte_order, sig.is_signed, sig.conversion.is_float)
+    
+    @contextmanager
+    def _shared_codec_formats(self):
+        """
+        Reuse cantools codec formats across messages while a database loads
+        
+        The patch is process-wide, so concurrent loads are serialized on
+        _signal_cache_lock; each patch is restored before the next one.
+        """
+        cache = self._signal_cache
+        lock = self._signal_cache_lock
+        
+        with lock:
+            original = cantools_message.create_encode_decode_formats
+            
+            def cached_formats(signals, number_of_bytes):
+                key = (number_of_bytes, tuple(self._signal_cache_key(sig) for sig in signals))
+                with lock:
+                    formats = cache.get(key)
+                    if formats is None:
+                        formats = cache[key] = original(signals, number_of_bytes)
+                        if len(cache) > self._signal_cache_size:
+                            cache.popitem(last=False)
+                    else:
+                        cache.move_to_end(key)
+                    return formats
+            
+            cantools_message.create_encode_decode_formats = cached_formats
+            try:
+                yield
+            finally:
+                cantools_message.create_encode_decode_formats = original
+    
     def _extract_from_cantools(self):
         """
         Extract information from cantools database
@@ -101,9 +380,9 @@ class DBCParser:
         for msg in self.db.messages:
             message = Message(
                 id=msg.frame_id,
-                name=msg.name,
+                name=sys.intern(msg.name),
                 dlc=msg.length,
-                sender=msg.senders[0] if msg.senders else "",
+                sender=sys.intern(msg.senders[0]) if msg.senders else "",
                 is_extended=msg.is_extended_frame
             )
             
@@ -116,7 +395,7 @@ class DBCParser:
             # Extract signals
             for sig in msg.signals:
                 signal = Signal(
-                    name=sig.name,
+                    name=sys.intern(sig.name),
                     start_bit=sig.start,
                     size=sig.length,
                     is_little_endian=(sig.byte_order == 'little_endian'),
@@ -125,8 +404,8 @@ class DBCParser:
                     offset=sig.offset,
                     minimum=sig.minimum if sig.minimum is not None else 0,
                     maximum=sig.maximum if sig.maximum is not None else 0,
-                    unit=sig.unit if sig.unit else "",
-                    receivers=list(sig.receivers) if sig.receivers else []
+                    unit=sys.intern(sig.unit) if sig.unit else "",
+                    receivers=[sys.intern(receiver) for receiver in sig.receivers] if sig.receivers else []
                 )
                 
                 if hasattr(sig, 'is_multiplexer'):
@@ -145,56 +424,69 @@ class DBCParser:
             for sig in msg.signals:
                 if sig.choices:
                     self.value_tables[f"{msg.name}.{sig.name}"] = sig.choices
+        
+        self._build_decode_caches()
     
     def _manual_parse(self, dbc_path: Path) -> Dict[str, Any]:
         """
         Manual DBC parsing as fallback
         """
         with open(dbc_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        # Parse nodes
-        self._parse_nodes(content)
-        
-        # Parse messages
-        self._parse_messages(content)
-        
-        # Parse signals
-        self._parse_signals(content)
+            self._parse_stream(f)
         
-        # Parse attributes
-        self._parse_attributes(content)
-        
-        # Parse value tables
-        self._parse_value_tables(content)
+        self._build_decode_caches()
         
         return {
-            'messages': self._messages_to_dict(),
-            'signals': self._signals_to_dict(),
+            'messages': _MessagesView(self.messages),
+            'signals': _SignalsView(self.signals),
             'nodes': self.nodes,
             'attributes': self.attributes,
             'value_tables': self.value_tables,
             'statistics': self.get_statistics()
         }
     
-    def _parse_nodes(self, content: str):
+    def _parse_stream(self, lines):
+        """
+        Parse DBC definitions in a single pass, dispatching on each line's keyword
+        """
+        handlers = {
+            'BU_': self._handle_bu,
+            'BO_': self._handle_bo,
+            'SG_': self._handle_sg,
+            'BA_DEF_': self._handle_ba_def,
+            'BA_': self._handle_ba,
+            'VAL_': self._handle_val
+        }
+        
+        # Message that following SG_ lines belong to
+        self._current_msg_id = None
+        
+        classify = _KEYWORD_RE.match
+        for line in lines:
+            # One match call classifies the line; comments, blank lines and
+            # unhandled sections are skipped without being stripped or split
+            keyword = classify(line)
+            if keyword:
+                handlers[keyword.group(1)](line.strip())
+    
+    def _handle_bu(self, line: str):
         """Parse network nodes from DBC"""
-        pattern = re.compile(r'BU_\s+(.*)')
-        match = pattern.search(content)
-        if match:
+        match = _BU_RE.match(line)
+        if match and not self.nodes:
             self.nodes = match.group(1).split()
     
-    def _parse_messages(self, content: str):
-        """Parse message definitions from DBC"""
-        pattern = re.compile(
-            r'BO_\s+(\d+)\s+(\w+):\s+(\d+)\s+(\w+)'
-        )
+    def _handle_bo(self, line: str):
+        """Parse a message definition from DBC"""
+        match = _BO_ID_RE.match(line)
+        if match:
+            self._current_msg_id = int(match.group(1))
         
-        for match in pattern.finditer(content):
+        match = _BO_RE.match(line)
+        if match:
             msg_id = int(match.group(1))
-            msg_name = match.group(2)
+            msg_name = sys.intern(match.group(2))
             dlc = int(match.group(3))
-            sender = match.group(4)
+            sender = sys.intern(match.group(4))
             
             # Check if extended ID (> 0x7FF for 11-bit IDs)
             is_extended = msg_id > 0x7FF
@@ -207,60 +499,45 @@ class DBCParser:
                 is_extended=is_extended
             )
     
-    def _parse_signals(self, content: str):
-        """Parse signal definitions from DBC"""
-        pattern = re.compile(
-            r'SG_\s+(\w+)\s*(?:(\w+)\s*)?:\s*(\d+)\|(\d+)@(\d+)([\+\-])\s*\(([^,]+),([^)]+)\)\s*\[([^|]+)\|([^\]]+)\]\s*"([^"]*)"\s*(.*)'
-        )
-        
-        current_msg_id = None
-        
-        # Find which message each signal belongs to
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            if line.strip().startswith('BO_'):
-                match = re.match(r'BO_\s+(\d+)', line)
-                if match:
-                    current_msg_id = int(match.group(1))
+    def _handle_sg(self, line: str):
+        """Parse a signal definition belonging to the current message"""
+        current_msg_id = self._current_msg_id
+        match = _SG_RE.match(line)
+        if match and current_msg_id is not None and current_msg_id in self.messages:
+            signal_name = sys.intern(match.group(1))
+            start_bit = int(match.group(3))
+            size = int(match.group(4))
+            byte_order = int(match.group(5))  # 0=motorola, 1=intel
+            is_signed = match.group(6) == '-'
+            factor = float(match.group(7))
+            offset = float(match.group(8))
+            minimum = float(match.group(9))
+            maximum = float(match.group(10))
+            # Units and receivers repeat across signals; intern them to share one copy
+            unit = sys.intern(match.group(11))
+            receivers = [sys.intern(receiver) for receiver in match.group(12).split()] if match.group(12) else []
             
-            elif line.strip().startswith('SG_'):
-                match = pattern.match(line.strip())
-                if match and current_msg_id and current_msg_id in self.messages:
-                    signal_name = match.group(1)
-                    start_bit = int(match.group(3))
-                    size = int(match.group(4))
-                    byte_order = int(match.group(5))  # 0=motorola, 1=intel
-                    is_signed = match.group(6) == '-'
-                    factor = float(match.group(7))
-                    offset = float(match.group(8))
-                    minimum = float(match.group(9))
-                    maximum = float(match.group(10))
-                    unit = match.group(11)
-                    receivers = match.group(12).split() if match.group(12) else []
-                    
-                    signal = Signal(
-                        name=signal_name,
-                        start_bit=start_bit,
-                        size=size,
-                        is_little_endian=(byte_order == 1),
-                        is_signed=is_signed,
-                        factor=factor,
-                        offset=offset,
-                        minimum=minimum,
-                        maximum=maximum,
-                        unit=unit,
-                        receivers=receivers
-                    )
-                    
-                    self.messages[current_msg_id].signals[signal_name] = signal
-                    self.signals[f"{self.messages[current_msg_id].name}.{signal_name}"] = signal
+            signal = Signal(
+                name=signal_name,
+                start_bit=start_bit,
+                size=size,
+                is_little_endian=(byte_order == 1),
+                is_signed=is_signed,
+                factor=factor,
+                offset=offset,
+                minimum=minimum,
+                maximum=maximum,
+                unit=unit,
+                receivers=receivers
+            )
+            
+            self.messages[current_msg_id].signals[signal_name] = signal
+            self.signals[f"{self.messages[current_msg_id].name}.{signal_name}"] = signal
     
-    def _parse_attributes(self, content: str):
-        """Parse attributes from DBC"""
-        # Parse attribute definitions
-        attr_def_pattern = re.compile(r'BA_DEF_\s+(\w+)?\s*"([^"]+)"\s+(\w+)')
-        
-        for match in attr_def_pattern.finditer(content):
+    def _handle_ba_def(self, line: str):
+        """Parse an attribute definition from DBC"""
+        match = _BA_DEF_RE.match(line)
+        if match:
             scope = match.group(1) if match.group(1) else "GLOBAL"
             attr_name = match.group(2)
             attr_type = match.group(3)
@@ -271,31 +548,29 @@ class DBCParser:
                     'type': attr_type,
                     'values': {}
                 }
-        
-        # Parse attribute values
-        attr_val_pattern = re.compile(r'BA_\s+"([^"]+)"\s+(.*);')
-        
-        for match in attr_val_pattern.finditer(content):
+    
+    def _handle_ba(self, line: str):
+        """Parse an attribute value from DBC"""
+        match = _BA_RE.match(line)
+        if match:
             attr_name = match.group(1)
             attr_value = match.group(2)
             
             if attr_name in self.attributes:
                 self.attributes[attr_name]['values']['default'] = attr_value
     
-    def _parse_value_tables(self, content: str):
-        """Parse value tables (enumerations) from DBC"""
-        pattern = re.compile(r'VAL_\s+(\d+)\s+(\w+)\s+((?:\d+\s+"[^"]+"\s*)+);')
-        
-        for match in pattern.finditer(content):
+    def _handle_val(self, line: str):
+        """Parse a value table (enumeration) from DBC"""
+        match = _VAL_RE.match(line)
+        if match:
             msg_id = int(match.group(1))
             signal_name = match.group(2)
             values_str = match.group(3)
             
             # Parse value pairs
-            value_pattern = re.compile(r'(\d+)\s+"([^"]+)"')
             values = {}
             
-            for value_match in value_pattern.finditer(values_str):
+            for value_match in _VAL_PAIR_RE.finditer(values_str):
                 value = int(value_match.group(1))
                 description = value_match.group(2)
                 values[value] = description
@@ -304,6 +579,36 @@ class DBCParser:
                 msg_name = self.messages[msg_id].name
                 self.value_tables[f"{msg_name}.{signal_name}"] = values
     
+    def _build_decode_caches(self):
+        """Precompute per-message decode lookups once parsing is complete"""
+        self._msg_by_std_id = [None] * 2048
+        self._msg_by_ext_id = {}
+        
+        for msg_id, message in self.messages.items():
+            self._build_decode_cache(message)
+            
+            if 0 <= msg_id < 2048:
+                self._msg_by_std_id[msg_id] = message
+            else:
+                self._msg_by_ext_id[msg_id] = message
+    
+    def _build_decode_cache(self, message: Message) -> List[Tuple[str, Signal, str, Optional[Dict[int, str]]]]:
+        """
+        Resolve interned names, units and value tables for a message's signals
+        so decoding doesn't rebuild "message.signal" keys for every frame
+        """
+        message._decode_cache = [
+            (
+                sys.intern(signal_name),
+                signal,
+                sys.intern(signal.unit),
+                self.value_tables.get(f"{message.name}.{signal_name}")
+            )
+            for signal_name, signal in message.signals.items()
+        ]
+        message._decode_plan = None
+        return message._decode_cache
+    
     def decode_message(self, can_id: int, data: bytes) -> Dict[str, Any]:
         """
         Decode CAN message using DBC definitions
@@ -322,24 +627,36 @@ class DBCParser:
                 return None
         
         # Manual decoding fallback
-        if can_id not in self.messages:
+        message = self._msg_by_std_id[can_id] if 0 <= can_id < 2048 else self._msg_by_ext_id.get(can_id)
+        if message is None:
             return None
         
-        message = self.messages[can_id]
+        return self._decode_manual(message, data)
+    
+    def _decode_manual(self, message: Message, data: bytes) -> Dict[str, Any]:
+        """
+        Decode CAN message signal by signal without cantools
+        """
         decoded_signals = {}
         
-        for signal_name, signal in message.signals.items():
+        # Convert the payload once per message for the native bit extractor
+        buf = np.frombuffer(data, dtype=np.uint8) if _extract_bits_native is not None else data
+        
+        decode_cache = message._decode_cache
+        if decode_cache is None:
+            decode_cache = self._build_decode_cache(message)
+        
+        for signal_name, signal, unit, value_table in decode_cache:
             try:
-                value = self._decode_signal(signal, data)
-                decoded_signals[signal_name] = {
+                value = self._decode_signal(signal, buf)
+                decoded = decoded_signals[signal_name] = {
                     'value': value,
-                    'unit': signal.unit
+                    'unit': unit
                 }
                 
                 # Add enumeration if available
-                key = f"{message.name}.{signal_name}"
-                if key in self.value_tables and int(value) in self.value_tables[key]:
-                    decoded_signals[signal_name]['text'] = self.value_tables[key][int(value)]
+                if value_table is not None and (int_value := int(value)) in value_table:
+                    decoded['text'] = value_table[int_value]
                     
             except Exception as e:
                 logger.debug(f"Error decoding signal {signal_name}: {e}")
@@ -349,6 +666,155 @@ class DBCParser:
             'signals': decoded_signals
         }
     
+    def decode_message_vec(self, can_id: int, data: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Decode CAN message from the DBC definitions with one NumPy pass per frame
+        
+        Produces the same result as the manual decode_message path. All signals
+        that fit in the first 64 bits are shifted and masked together; wider or
+        malformed signals go through _decode_signal.
+        """
+        message = self._msg_by_std_id[can_id] if 0 <= can_id < 2048 else self._msg_by_ext_id.get(can_id)
+        if message is None:
+            return None
+        
+        plan = message._decode_plan
+        if plan is None:
+            if np is None:
+                return self._decode_manual(message, data)
+            plan = message._decode_plan = self._build_decode_plan(message)
+        
+        payload = bytes(data[:8]).ljust(8, b'\0')
+        intel = np.uint64(int.from_bytes(payload, 'little'))
+        motorola = np.uint64(int.from_bytes(payload.translate(_BIT_REVERSE), 'little'))
+        
+        raw = (np.where(plan.motorola, motorola, intel) >> plan.shifts) & plan.masks
+        values = raw.astype(np.float64) - ((raw & plan.sign_bits) != 0) * plan.wraps
+        values = values * plan.factors + plan.offsets
+        values = np.where(plan.clamp, np.maximum(plan.minimums, np.minimum(plan.maximums, values)), values)
+        
+        values = values.tolist()
+        short = (plan.required_bits > len(data) * 8).tolist()
+        decoded_signals = {}
+        
+        for signal_name, signal, unit, value_table, index in plan.order:
+            try:
+                if index < 0:
+                    value = self._decode_signal(signal, data)
+                else:
+                    value = 0 if short[index] else values[index]
+                decoded = decoded_signals[signal_name] = {
+                    'value': value,
+                    'unit': unit
+                }
+                
+                # Add enumeration if available
+                if value_table is not None and (int_value := int(value)) in value_table:
+                    decoded['text'] = value_table[int_value]
+                    
+            except Exception as e:
+                logger.debug(f"Error decoding signal {signal_name}: {e}")
+        
+        return {
+            'message_name': message.name,
+            'signals': decoded_signals
+        }
+    
+    def decode_frames(self, ids, payloads) -> Dict[str, Any]:
+        """
+        Decode a batch of CAN frames, one column per signal
+        
+        ids is a uint32[N] array of CAN IDs and payloads a uint8[N, 8] array
+        (narrower rows are zero-padded, only the first 8 bytes are read).
+        Returns one pyarrow RecordBatch per message name, with a _frame_index
+        column holding each row's position in the input; without pyarrow the
+        same columns are returned as a dict of NumPy arrays. Values match
+        decode_message_vec; frames with unknown IDs are skipped.
+        """
+        if np is None:
+            raise RuntimeError("decode_frames requires NumPy")
+        
+        ids = np.asarray(ids)
+        payloads = np.asarray(payloads, dtype=np.uint8)
+        if ids.ndim != 1 or payloads.ndim != 2:
+            raise ValueError("ids must be a 1-D array and payloads a 2-D [N, width] array")
+        width = payloads.shape[1]
+        if payloads.shape[0] != ids.shape[0]:
+            raise ValueError("ids and payloads must have the same number of rows")
+        
+        frames = np.zeros((len(ids), 8), dtype=np.uint8)
+        frames[:, :min(width, 8)] = payloads[:, :8]
+        intel = frames.view('<u8').ravel()
+        motorola = _BIT_REVERSE_TABLE[frames].view('<u8').ravel()
+        
+        # Group row positions by CAN ID without a Python loop over frames
+        unique_ids, inverse = np.unique(ids, return_inverse=True)
+        rows_by_id = np.split(np.argsort(inverse, kind='stable'), np.cumsum(np.bincount(inverse))[:-1])
+        
+        batches = {}
+        for can_id, rows in zip(unique_ids.tolist(), rows_by_id):
+            message = self._msg_by_std_id[can_id] if 0 <= can_id < 2048 else self._msg_by_ext_id.get(can_id)
+            if message is None:
+                continue
+            
+            plan = message._decode_plan
+            if plan is None:
+                plan = message._decode_plan = self._build_decode_plan(message)
+            
+            raw = (np.where(plan.motorola, motorola[rows, None], intel[rows, None]) >> plan.shifts) & plan.masks
+            values = raw.astype(np.float64) - ((raw & plan.sign_bits) != 0) * plan.wraps
+            values = values * plan.factors + plan.offsets
+            values = np.where(plan.clamp, np.maximum(plan.minimums, np.minimum(plan.maximums, values)), values)
+            values[:, plan.required_bits > width * 8] = 0
+            
+            columns = {'_frame_index': rows.astype(np.int64)}
+            for signal_name, signal, unit, value_table, index in plan.order:
+                if index < 0:
+                    # Wide signals keep their exact Python values (may exceed float64 precision)
+                    columns[signal_name] = [self._decode_signal(signal, bytes(row)) for row in payloads[rows]]
+                else:
+                    columns[signal_name] = values[:, index]
+            
+            batches[message.name] = pa.RecordBatch.from_pydict(columns) if pa is not None else columns
+        
+        return batches
+    
+    def _build_decode_plan(self, message: Message) -> _DecodePlan:
+        """
+        Precompute the shift/mask/scale arrays used by decode_message_vec
+        """
+        order = []
+        vector = []
+        decode_cache = message._decode_cache
+        if decode_cache is None:
+            decode_cache = self._build_decode_cache(message)
+        
+        for entry in decode_cache:
+            signal = entry[1]
+            low_bit = signal.start_bit if signal.is_little_endian else signal.start_bit - signal.size + 1
+            
+            # Stay within 53 bits so the float64 math matches the scalar path exactly
+            if 0 < signal.size <= 53 and 0 <= low_bit and low_bit + signal.size <= 64:
+                order.append(entry + (len(vector),))
+                vector.append((signal, low_bit))
+            else:
+                order.append(entry + (-1,))
+        
+        return _DecodePlan(
+            order=order,
+            motorola=np.array([not sig.is_little_endian for sig, _ in vector], dtype=bool),
+            shifts=np.array([low_bit for _, low_bit in vector], dtype=np.uint64),
+            masks=np.array([(1 << sig.size) - 1 for sig, _ in vector], dtype=np.uint64),
+            sign_bits=np.array([sig._sign_mask for sig, _ in vector], dtype=np.uint64),
+            wraps=np.array([float(1 << sig.size) if sig.is_signed else 0.0 for sig, _ in vector], dtype=np.float64),
+            factors=np.array([sig.factor for sig, _ in vector], dtype=np.float64),
+            offsets=np.array([sig.offset for sig, _ in vector], dtype=np.float64),
+            minimums=np.array([sig.minimum for sig, _ in vector], dtype=np.float64),
+            maximums=np.array([sig.maximum for sig, _ in vector], dtype=np.float64),
+            clamp=np.array([sig._clamp for sig, _ in vector], dtype=bool),
+            required_bits=np.array([sig.start_bit + sig.size for sig, _ in vector], dtype=np.int64)
+        )
+    
     def _decode_signal(self, signal: Signal, data: bytes) -> float:
         """
         Decode a signal value from CAN data
@@ -357,37 +823,24 @@ class DBCParser:
             return 0  # Not enough data
         
         # Extract bits
-        value = 0
-        
-        if signal.is_little_endian:
-            # Intel byte order
-            for i in range(signal.size):
-                byte_index = (signal.start_bit + i) // 8
-                bit_index = (signal.start_bit + i) % 8
-                
-                if byte_index < len(data):
-                    bit_value = (data[byte_index] >> bit_index) & 1
-                    value |= bit_value << i
+        if _extract_bits_native is not None and signal.size < 64:
+            if not isinstance(data, np.ndarray):
+                data = np.frombuffer(data, dtype=np.uint8)
+            value = int(_extract_bits_native(data, signal.start_bit, signal.size, signal.is_little_endian))
         else:
-            # Motorola byte order
-            for i in range(signal.size):
-                bit_position = signal.start_bit - i
-                byte_index = bit_position // 8
-                bit_index = 7 - (bit_position % 8)
-                
-                if 0 <= byte_index < len(data):
-                    bit_value = (data[byte_index] >> bit_index) & 1
-                    value |= bit_value << (signal.size - 1 - i)
+            if _extract_bits_native is not None and isinstance(data, np.ndarray):
+                data = data.tobytes()  # Python ints avoid int64 overflow on wide signals
+            value = _extract_bits(data, signal.start_bit, signal.size, signal.is_little_endian)
         
-        # Handle signed values
-        if signal.is_signed and value & (1 << (signal.size - 1)):
-            value -= (1 << signal.size)
+        # Handle signed values (two's complement; a no-op when _sign_mask is 0)
+        sign_mask = signal._sign_mask
+        value = (value ^ sign_mask) - sign_mask
         
         # Apply factor and offset
         physical_value = value * signal.factor + signal.offset
         
         # Clamp to min/max
-        if signal.minimum != 0 or signal.maximum != 0:
+        if signal._clamp:
             physical_value = max(signal.minimum, min(signal.maximum, physical_value))
         
         return physical_value
@@ -408,41 +861,6 @@ class DBCParser:
             'total_value_tables': len(self.value_tables)
         }
     
-    def _messages_to_dict(self) -> Dict[str, Any]:
-        """Convert messages to dictionary format"""
-        return {
-            str(msg_id): {
-                'id': msg.id,
-                'name': msg.name,
-                'dlc': msg.dlc,
-                'sender': msg.sender,
-                'is_extended': msg.is_extended,
-                'cycle_time': msg.cycle_time,
-                'comment': msg.comment,
-                'signals': list(msg.signals.keys())
-            }
-            for msg_id, msg in self.messages.items()
-        }
-    
-    def _signals_to_dict(self) -> Dict[str, Any]:
-        """Convert signals to dictionary format"""
-        return {
-            name: {
-                'name': sig.name,
-                'start_bit': sig.start_bit,
-                'size': sig.size,
-                'is_little_endian': sig.is_little_endian,
-                'is_signed': sig.is_signed,
-                'factor': sig.factor,
-                'offset': sig.offset,
-                'minimum': sig.minimum,
-                'maximum': sig.maximum,
-                'unit': sig.unit,
-                'receivers': sig.receivers
-            }
-            for name, sig in self.signals.items()
-        }
-    
     def validate_format(self, file_path: Path) -> bool:
         """
         Validate if file is a valid DBC file
@@ -458,3 +876,10 @@ class DBCParser:
         except Exception as e:
             logger.error(f"Error validating DBC format: {e}")
             return False
+
+@functools.lru_cache(maxsize=32)
+def _load_dbc_cached(path: str, mtime_ns: int, size: int) -> DBCParser:
+    """Parse a DBC file once per (path, mtime, size)"""
+    parser = DBCParser()
+    parser._load(Path(path))
+    return parser
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class INCAMessage:
     """Represents a single INCA message"""
     timestamp: float
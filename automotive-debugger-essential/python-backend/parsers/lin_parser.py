@@ -3,15 +3,29 @@ LIN Parser Module
 Parses LIN (Local Interconnect Network) log files
 """
 
+import os
 import re
+import mmap
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Generator
+from typing import List, Dict, Any, Optional, Generator, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Decoded payloads keyed by their hex text. LIN frames are short (<= 8 bytes)
+# and highly repetitive, so a dict hit beats re-running bytes.fromhex and
+# lets identical payloads share one bytes object.
+_PAYLOAD_CACHE: Dict[str, bytes] = {}
+_PAYLOAD_CACHE_SIZE = 4096
+
+# One LIN frame line, compiled once per process: LIN <timestamp> <frame id> <hex data>
+_LIN_RE = re.compile(r'LIN\s+(\d+\.\d+)\s+(\d+)\s+([0-9A-Fa-f]+)')
+
+# A LIN frame line anywhere in the first block of the file
+_VALIDATE_RE = re.compile(rb'(?m)^[ \t]*LIN[ \t]+\d+\.\d+[ \t]+\d+[ \t]+[0-9A-Fa-f]+')
+
+@dataclass(slots=True)
 class LINMessage:
     """Represents a single LIN message"""
     timestamp: float
@@ -35,20 +49,14 @@ class LINParser:
     
     def __init__(self):
         self.patterns = {
-            'lin': re.compile(r'LIN\s+(\d+\.\d+)\s+(\d+)\s+([0-9A-Fa-f]+)')
+            'lin': _LIN_RE
         }
     
     def validate_format(self, file_path: Path) -> bool:
         """Validate if file is a valid LIN log"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for _ in range(10):
-                    line = f.readline()
-                    if not line:
-                        break
-                    if self.patterns['lin'].match(line.strip()):
-                        return True
-            return False
+            with open(file_path, 'rb') as f:
+                return _VALIDATE_RE.search(f.read(4096)) is not None
         except Exception as e:
             logger.error(f"Error validating LIN format: {e}")
             return False
@@ -63,48 +71,94 @@ class LINParser:
         messages_buffer = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
+            for line in self._iter_lines(file_path):
+                message = self.parse_line(line)
+                if message:
+                    messages_buffer.append(message)
                     
-                    message = self.parse_line(line)
-                    if message:
-                        messages_buffer.append(message)
-                        
-                        if len(messages_buffer) >= chunk_size:
-                            yield messages_buffer
-                            messages_buffer = []
-                
-                if messages_buffer:
-                    yield messages_buffer
+                    if len(messages_buffer) >= chunk_size:
+                        yield messages_buffer
+                        messages_buffer = []
+            
+            if messages_buffer:
+                yield messages_buffer
                     
         except Exception as e:
             logger.error(f"Error reading file: {e}")
             raise
     
+    def _iter_lines(self, file_path: Path) -> Generator[str, None, None]:
+        """
+        Yield stripped, non-comment lines from a memory-mapped log
+        
+        Blank and comment lines are rejected on the raw bytes so only lines
+        that may hold a frame are decoded to str.
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return  # mmap refuses empty files
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = 0
+                end = len(mm)
+                while pos < end:
+                    nl = mm.find(b'\n', pos)
+                    if nl == -1:
+                        nl = end
+                    
+                    line = mm[pos:nl].strip()
+                    pos = nl + 1
+                    
+                    if not line or line.startswith(b'#'):
+                        continue
+                    
+                    yield line.decode('utf-8', 'ignore')
+    
     def parse_line(self, line: str) -> Optional[LINMessage]:
         """Parse a single line of LIN log"""
+        fields = self._parse_fields(line)
+        if fields is None:
+            return None
+        
+        timestamp, frame_id, data_bytes = fields
+        return LINMessage(
+            timestamp=timestamp,
+            frame_id=frame_id,
+            data=data_bytes,
+            checksum=0  # Placeholder
+        )
+    
+    def _parse_fields(self, line: str) -> Optional[Tuple[float, int, bytes]]:
+        """
+        Match one LIN line and return its (timestamp, frame ID, payload)
+        
+        Shared by parse_line and the stats scan so both accept the same
+        lines. The payload is the leading hex run of the data field; an
+        odd-length run can't be decoded and the line is skipped.
+        """
         match = self.patterns['lin'].match(line)
-        if match:
-            timestamp = float(match.group(1))
-            frame_id = int(match.group(2))
-            data_str = match.group(3)
-            
-            data_bytes = bytes.fromhex(data_str) if data_str else b''
-            
-            return LINMessage(
-                timestamp=timestamp,
-                frame_id=frame_id,
-                data=data_bytes,
-                checksum=0  # Placeholder
-            )
-        
-        return None
+        if not match:
+            return None
+        
+        data_str = match.group(3)
+        data_bytes = _PAYLOAD_CACHE.get(data_str)
+        if data_bytes is None:
+            try:
+                data_bytes = bytes.fromhex(data_str)
+            except ValueError:
+                return None
+            if len(data_str) <= 16 and len(_PAYLOAD_CACHE) < _PAYLOAD_CACHE_SIZE:
+                _PAYLOAD_CACHE[data_str] = data_bytes
+        
+        return float(match.group(1)), int(match.group(2)), data_bytes
     
-    def get_file_stats(self, file_path: str) -> Dict[str, Any]:
-        """Get statistics about the LIN log file"""
+    def get_file_stats(self, file_path: str, detailed: bool = False) -> Dict[str, Any]:
+        """
+        Get statistics about the LIN log file
+        
+        By default only the timestamp and frame ID columns are scanned; pass
+        detailed=True to build every LINMessage through parse_file instead.
+        """
         stats = {
             'total_messages': 0,
             'unique_frame_ids': set(),
@@ -115,14 +169,18 @@ class LINParser:
         first_timestamp = None
         last_timestamp = None
         
-        for chunk in self.parse_file(file_path, chunk_size=10000):
-            for msg in chunk:
-                stats['total_messages'] += 1
-                stats['unique_frame_ids'].add(msg.frame_id)
-                
-                if first_timestamp is None:
-                    first_timestamp = msg.timestamp
-                last_timestamp = msg.timestamp
+        if detailed:
+            for chunk in self.parse_file(file_path, chunk_size=10000):
+                for msg in chunk:
+                    stats['total_messages'] += 1
+                    stats['unique_frame_ids'].add(msg.frame_id)
+                    
+                    if first_timestamp is None:
+                        first_timestamp = msg.timestamp
+                    last_timestamp = msg.timestamp
+        else:
+            (stats['total_messages'], stats['unique_frame_ids'],
+             first_timestamp, last_timestamp) = self._scan_ids_and_times(Path(file_path))
         
         stats['unique_frame_ids'] = len(stats['unique_frame_ids'])
         
@@ -131,3 +189,29 @@ class LINParser:
             stats['time_range']['end'] = last_timestamp
         
         return stats
+    
+    def _scan_ids_and_times(self, file_path: Path):
+        """
+        Count frames and collect frame IDs and first/last timestamps
+        
+        Accepts exactly the lines parse_line accepts, without allocating a
+        LINMessage per frame.
+        """
+        total = 0
+        ids = set()
+        first_timestamp = None
+        last_timestamp = None
+        
+        for line in self._iter_lines(file_path):
+            fields = self._parse_fields(line)
+            if fields is None:
+                continue
+            
+            timestamp, frame_id, _ = fields
+            total += 1
+            ids.add(frame_id)
+            if first_timestamp is None:
+                first_timestamp = timestamp
+            last_timestamp = timestamp
+        
+        return total, ids, first_timestamp, last_timestamp
@@ -3,14 +3,49 @@ PCAP Parser Module
 Parses PCAP network capture files
 """
 
+import os
+import mmap
+import struct
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Generator
+from typing import List, Dict, Any, Optional, Generator, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Classic PCAP magic numbers -> (struct byte order, timestamp fraction unit)
+_PCAP_MAGIC = {
+    b'\xd4\xc3\xb2\xa1': ('<', 1e-6),
+    b'\xa1\xb2\xc3\xd4': ('>', 1e-6),
+    b'\x4d\x3c\xb2\xa1': ('<', 1e-9),  # Nanosecond resolution
+    b'\xa1\xb2\x3c\x4d': ('>', 1e-9),
+}
+
+_GLOBAL_HEADER_SIZE = 24
+_RECORD_HEADER_SIZE = 16
+
+# Link-layer header types (network field of the global header)
+_LINKTYPE_ETHERNET = 1
+_LINKTYPE_NAMES = {
+    101: 'IP',
+    113: 'Linux SLL',
+    227: 'CAN',  # SocketCAN
+}
+
+_ETHERTYPE_NAMES = {
+    0x0800: 'IPv4',
+    0x0806: 'ARP',
+    0x22F0: 'AVTP',
+    0x86DD: 'IPv6',
+    0x88F7: 'PTP',
+}
+
+_IP_PROTOCOL_NAMES = {
+    6: 'TCP',
+    17: 'UDP',
+}
+
+@dataclass(slots=True)
 class PCAPMessage:
     """Represents a single PCAP message"""
     timestamp: float
@@ -25,6 +60,20 @@ class PCAPMessage:
             'data': self.data.hex()
         }
 
+def _classify(linktype: int, packet: bytes) -> str:
+    """Name the protocol of a captured packet from its link-layer headers"""
+    if linktype != _LINKTYPE_ETHERNET:
+        return _LINKTYPE_NAMES.get(linktype, f"LINKTYPE_{linktype}")
+    
+    if len(packet) < 14:
+        return 'Ethernet'
+    
+    ethertype = (packet[12] << 8) | packet[13]
+    if ethertype == 0x0800 and len(packet) >= 24:
+        return _IP_PROTOCOL_NAMES.get(packet[23], 'IPv4')
+    
+    return _ETHERTYPE_NAMES.get(ethertype, 'Ethernet')
+
 class PCAPParser:
     """
     Parser for PCAP files
@@ -39,7 +88,7 @@ class PCAPParser:
             with open(file_path, 'rb') as f:
                 header = f.read(4)
                 # Check for PCAP magic number
-                return header in [b'\xd4\xc3\xb2\xa1', b'\xa1\xb2\xc3\xd4']
+                return header in _PCAP_MAGIC
         except Exception as e:
             logger.error(f"Error validating PCAP format: {e}")
             return False
@@ -51,13 +100,61 @@ class PCAPParser:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        # Placeholder implementation - PCAP parsing is complex
-        logger.warning("PCAP parsing not fully implemented - using placeholder")
-        
         messages_buffer = []
         
-        # For now, return empty chunks
-        yield messages_buffer
+        try:
+            for timestamp, linktype, packet in self._iter_packets(file_path):
+                messages_buffer.append(PCAPMessage(
+                    timestamp=timestamp,
+                    protocol=_classify(linktype, packet),
+                    data=packet
+                ))
+                
+                if len(messages_buffer) >= chunk_size:
+                    yield messages_buffer
+                    messages_buffer = []
+            
+            if messages_buffer:
+                yield messages_buffer
+        
+        except Exception as e:
+            logger.error(f"Error reading file: {e}")
+            raise
+    
+    def _iter_packets(self, file_path: Path) -> Generator[Tuple[float, int, bytes], None, None]:
+        """
+        Yield (timestamp, linktype, packet) for each record of a classic PCAP file
+        
+        Record headers are unpacked in place from a read-only mmap, so the only
+        per-packet copy is the packet payload itself.
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _GLOBAL_HEADER_SIZE:
+                logger.warning(f"PCAP file too short for a global header: {file_path}")
+                return
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic = mm[:4]
+                if magic not in _PCAP_MAGIC:
+                    logger.warning(f"Unsupported capture format (only classic PCAP is parsed): {file_path}")
+                    return
+                
+                byte_order, fraction_unit = _PCAP_MAGIC[magic]
+                linktype = struct.unpack_from(f"{byte_order}I", mm, 20)[0]
+                record_header = struct.Struct(f"{byte_order}IIII")
+                
+                pos = _GLOBAL_HEADER_SIZE
+                end = len(mm)
+                while pos + _RECORD_HEADER_SIZE <= end:
+                    ts_sec, ts_frac, incl_len, _ = record_header.unpack_from(mm, pos)
+                    pos += _RECORD_HEADER_SIZE
+                    
+                    if pos + incl_len > end:
+                        logger.warning(f"Truncated PCAP record at offset {pos - _RECORD_HEADER_SIZE}")
+                        break
+                    
+                    yield ts_sec + ts_frac * fraction_unit, linktype, mm[pos:pos + incl_len]
+                    pos += incl_len
     
     def parse_line(self, line: str) -> Optional[PCAPMessage]:
         """Parse a single line (not applicable for binary format)"""
@@ -65,9 +162,29 @@ class PCAPParser:
     
     def get_file_stats(self, file_path: str) -> Dict[str, Any]:
         """Get statistics about the PCAP file"""
-        return {
+        stats = {
             'total_messages': 0,
+            'protocols': {},
+            'time_range': {'start': None, 'end': None},
             'file_size': Path(file_path).stat().st_size,
-            'format': 'PCAP (Network Capture)',
-            'note': 'PCAP parsing not fully implemented'
+            'format': 'PCAP (Network Capture)'
         }
+        
+        first_timestamp = None
+        last_timestamp = None
+        protocols = stats['protocols']
+        
+        for timestamp, linktype, packet in self._iter_packets(Path(file_path)):
+            stats['total_messages'] += 1
+            protocol = _classify(linktype, packet)
+            protocols[protocol] = protocols.get(protocol, 0) + 1
+            
+            if first_timestamp is None:
+                first_timestamp = timestamp
+            last_timestamp = timestamp
+        
+        if first_timestamp is not None:
+            stats['time_range']['start'] = first_timestamp
+            stats['time_range']['end'] = last_timestamp
+        
+        return stats
@@ -3,15 +3,37 @@ UDS Parser Module
 Parses UDS (Unified Diagnostic Services) log files
 """
 
+import os
 import re
+import mmap
+from binascii import unhexlify
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Generator
+from typing import List, Dict, Any, Optional, Generator, Tuple
 from dataclasses import dataclass
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Compiled once per process and shared by every UDSParser. Bytes patterns:
+# log lines are matched undecoded, only the matched source/target fields
+# are turned into str. _UDS_STREAM_RE is the same pattern anchored at each
+# line start, for scanning a whole file; [^\S\n] keeps a match within one line
+_UDS_RE = re.compile(rb'UDS\s+(\d+\.\d+)\s+(\w+)\s+->\s+(\w+)\s+([0-9A-Fa-f]+)')
+_UDS_STREAM_RE = re.compile(
+    rb'(?m)^[^\S\n]*UDS[^\S\n]+(\d+\.\d+)[^\S\n]+(\w+)[^\S\n]+->[^\S\n]+(\w+)[^\S\n]+([0-9A-Fa-f]+)'
+)
+
+# ASCII hex digit -> nibble value, for decoding service IDs column-wise
+if np is not None:
+    _HEX_NIBBLE = np.zeros(256, dtype=np.uint8)
+    for _digit in b'0123456789abcdefABCDEF':
+        _HEX_NIBBLE[_digit] = int(chr(_digit), 16)
+
+@dataclass(slots=True)
 class UDSMessage:
     """Represents a single UDS message"""
     timestamp: float
@@ -20,7 +42,6 @@ class UDSMessage:
     service_id: int
     data: bytes
     response_code: Optional[int] = None
-    raw_line: str = ""
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -39,13 +60,14 @@ class UDSParser:
     
     def __init__(self):
         self.patterns = {
-            'uds': re.compile(r'UDS\s+(\d+\.\d+)\s+(\w+)\s+->\s+(\w+)\s+([0-9A-Fa-f]+)')
+            'uds': _UDS_RE,
+            'uds_stream': _UDS_STREAM_RE
         }
     
     def validate_format(self, file_path: Path) -> bool:
         """Validate if file is a valid UDS log"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            with open(file_path, 'rb') as f:
                 for _ in range(10):
                     line = f.readline()
                     if not line:
@@ -67,49 +89,152 @@ class UDSParser:
         messages_buffer = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    message = self.parse_line(line)
-                    if message:
-                        messages_buffer.append(message)
-                        
-                        if len(messages_buffer) >= chunk_size:
-                            yield messages_buffer
-                            messages_buffer = []
+            for match in self._iter_matches(file_path):
+                messages_buffer.append(self._message_from_match(match))
                 
-                if messages_buffer:
+                if len(messages_buffer) >= chunk_size:
                     yield messages_buffer
+                    messages_buffer = []
+            
+            if messages_buffer:
+                yield messages_buffer
                     
         except Exception as e:
             logger.error(f"Error reading file: {e}")
             raise
     
-    def parse_line(self, line: str) -> Optional[UDSMessage]:
-        """Parse a single line of UDS log"""
-        match = self.patterns['uds'].match(line)
-        if match:
-            timestamp = float(match.group(1))
-            source = match.group(2)
-            target = match.group(3)
-            data_str = match.group(4)
+    def parse_file_arrays(self, file_path: str, chunk_size: int = 10000,
+                          payloads: bool = True) -> Generator[Tuple[Any, Any, Optional[List[bytes]]], None, None]:
+        """
+        Parse UDS log file in chunks of columns instead of UDSMessage objects
+        
+        Yields (timestamps, service_ids, payloads) per chunk: a float64 array,
+        a uint8 array and a list of the decoded payloads. With payloads=False
+        the payload list is None and only the first byte of each payload is
+        decoded, from its two hex digits, for the whole chunk at once.
+        """
+        if not payloads:
+            yield from self._parse_service_arrays(file_path, chunk_size)
+            return
+        
+        if np is None:
+            raise RuntimeError("parse_file_arrays requires NumPy")
+        
+        file_path = Path(file_path)
+        
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        timestamps = []
+        service_ids = []
+        chunk_payloads = []
+        
+        try:
+            for match in self._iter_matches(file_path):
+                timestamp, data_str = match.group(1, 4)
+                data_bytes = unhexlify(data_str)
+                timestamps.append(timestamp)
+                service_ids.append(data_bytes[0])
+                chunk_payloads.append(data_bytes)
+                
+                if len(chunk_payloads) >= chunk_size:
+                    yield np.array(timestamps).astype(np.float64), np.array(service_ids, dtype=np.uint8), chunk_payloads
+                    timestamps, service_ids, chunk_payloads = [], [], []
             
-            data_bytes = bytes.fromhex(data_str) if data_str else b''
-            service_id = data_bytes[0] if data_bytes else 0
+            if chunk_payloads:
+                yield np.array(timestamps).astype(np.float64), np.array(service_ids, dtype=np.uint8), chunk_payloads
+                    
+        except Exception as e:
+            logger.error(f"Error reading file: {e}")
+            raise
+    
+    def _parse_service_arrays(self, file_path: str, chunk_size: int) -> Generator[Tuple[Any, Any, None], None, None]:
+        """parse_file_arrays(payloads=False): timestamps and service IDs only"""
+        if np is None:
+            raise RuntimeError("parse_file_arrays requires NumPy")
+        
+        file_path = Path(file_path)
+        
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        timestamps = []
+        leading_digits = []
+        
+        try:
+            for match in self._iter_matches(file_path):
+                timestamp, data_str = match.group(1, 4)
+                if len(data_str) & 1:
+                    unhexlify(data_str)  # Raises the same error as a full decode
+                timestamps.append(timestamp)
+                leading_digits.append(data_str[:2])
+                
+                if len(timestamps) >= chunk_size:
+                    yield np.array(timestamps).astype(np.float64), self._service_ids(leading_digits), None
+                    timestamps, leading_digits = [], []
             
-            return UDSMessage(
-                timestamp=timestamp,
-                source=source,
-                target=target,
-                service_id=service_id,
-                data=data_bytes
-            )
+            if timestamps:
+                yield np.array(timestamps).astype(np.float64), self._service_ids(leading_digits), None
+                    
+        except Exception as e:
+            logger.error(f"Error reading file: {e}")
+            raise
+    
+    @staticmethod
+    def _service_ids(leading_digits: List[bytes]):
+        """Decode each payload's first byte from its leading two hex digits"""
+        digits = _HEX_NIBBLE[np.frombuffer(b''.join(leading_digits), dtype=np.uint8)]
+        return (digits[0::2] << 4) | digits[1::2]
+    
+    def _iter_matches(self, file_path: Path):
+        """Yield a 'uds_stream' match for every UDS line of a memory-mapped log"""
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return  # mmap refuses empty files
+            
+            # One finditer over the mapped file: comment, blank and
+            # non-UDS lines are skipped inside the regex engine
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # The scan is strictly front to back: ask the kernel for
+                # aggressive readahead (Linux/BSD)
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                yield from self.patterns['uds_stream'].finditer(mm)
+    
+    def parse_line(self, line) -> Optional[UDSMessage]:
+        """Parse a single line of UDS log (str or raw bytes)"""
+        if isinstance(line, str):
+            line = line.encode('utf-8', 'ignore')
+        
+        # The pattern is anchored on a leading 'UDS': reject everything else
+        # without entering the regex engine
+        if not line.startswith(b'UDS'):
+            return None
+        
+        match = self.patterns['uds'].match(line)
+        if match:
+            return self._message_from_match(match)
         
         return None
     
+    def _message_from_match(self, match) -> UDSMessage:
+        """Build a UDSMessage from a 'uds' or 'uds_stream' match"""
+        timestamp = float(match.group(1))
+        source = match.group(2).decode('ascii')
+        target = match.group(3).decode('ascii')
+        data_str = match.group(4)
+        
+        data_bytes = unhexlify(data_str) if data_str else b''
+        service_id = data_bytes[0] if data_bytes else 0
+        
+        return UDSMessage(
+            timestamp=timestamp,
+            source=source,
+            target=target,
+            service_id=service_id,
+            data=data_bytes
+        )
+    
     def get_file_stats(self, file_path: str) -> Dict[str, Any]:
         """Get statistics about the UDS log file"""
         stats = {
@@ -122,16 +247,29 @@ class UDSParser:
         first_timestamp = None
         last_timestamp = None
         
-        for chunk in self.parse_file(file_path, chunk_size=10000):
-            for msg in chunk:
-                stats['total_messages'] += 1
-                stats['unique_services'].add(msg.service_id)
+        if np is not None:
+            # Column chunks: service IDs are marked in a 256-slot table
+            seen_services = np.zeros(256, dtype=bool)
+            for timestamps, service_ids, _ in self.parse_file_arrays(file_path, chunk_size=10000, payloads=False):
+                stats['total_messages'] += len(timestamps)
+                seen_services[service_ids] = True
                 
                 if first_timestamp is None:
-                    first_timestamp = msg.timestamp
-                last_timestamp = msg.timestamp
-        
-        stats['unique_services'] = len(stats['unique_services'])
+                    first_timestamp = float(timestamps[0])
+                last_timestamp = float(timestamps[-1])
+            
+            stats['unique_services'] = int(seen_services.sum())
+        else:
+            # Whole-chunk updates; only the chunk edges carry the time range
+            for chunk in self.parse_file(file_path, chunk_size=10000):
+                stats['total_messages'] += len(chunk)
+                stats['unique_services'].update([msg.service_id for msg in chunk])
+                
+                if first_timestamp is None:
+                    first_timestamp = chunk[0].timestamp
+                last_timestamp = chunk[-1].timestamp
+            
+            stats['unique_services'] = len(stats['unique_services'])
         
         if first_timestamp and last_timestamp:
             stats['time_range']['start'] = first_timestamp
@@ -2,12 +2,23 @@
 """
 Timeout wrapper for running main.py with monitoring (Windows compatible)
 """
-import subprocess
+import asyncio
+import re
 import time
 import sys
-import os
-import threading
-from threading import Timer
+
+# Server startup indicators, matched on the raw output bytes
+_START_RE = re.compile(rb'Uvicorn running on|Application startup complete')
+
+# Echoed output is written in batches: every _FLUSH_LINES lines or
+# _FLUSH_INTERVAL seconds, and at once for startup and ERROR/WARN lines
+_FLUSH_LINES = 100
+_FLUSH_INTERVAL = 0.5
+_URGENT_RE = re.compile(rb'ERROR|WARN')
+
+# Longest output line readline() accepts. asyncio's 64 KiB default is easily
+# exceeded by a large traceback or JSON log line.
+_LINE_LIMIT = 16 * 1024 * 1024
 
 def run_with_timeout(timeout_seconds=30):
     """
@@ -17,56 +28,94 @@ def run_with_timeout(timeout_seconds=30):
     print(f"[MONITOR] Expected startup time: ~10-15s, threshold: {timeout_seconds}s")
     
     start_time = time.time()
-    process = None
-    timeout_occurred = threading.Event()
     
-    def timeout_handler():
-        print(f"\n[TIMEOUT] Process exceeded {timeout_seconds}s, terminating...")
-        timeout_occurred.set()
-        if process:
-            process.terminate()
-            try:
-                process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                process.kill()
+    try:
+        return asyncio.run(_monitor(timeout_seconds, start_time))
+    except KeyboardInterrupt:
+        print(f"\n[INTERRUPT] User interrupted after {time.time() - start_time:.1f}s")
+        return 1
+    except Exception as e:
+        print(f"[ERROR] Exception occurred: {e}")
+        return 1
+
+async def _monitor(timeout_seconds, start_time):
+    """
+    Echo main.py output until it exits; the startup deadline is enforced on
+    the pending readline itself, so no timer thread or polling is needed
+    """
+    # Run main.py
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "main.py",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        limit=_LINE_LIMIT
+    )
+    
+    print(f"[MONITOR] Process started with PID: {process.pid}")
     
-    # Set up timeout timer
-    timeout_timer = Timer(timeout_seconds, timeout_handler)
-    timeout_timer.start()
+    started = False
+    pending = []
+    last_flush = time.time()
     
+    def flush():
+        nonlocal last_flush
+        if pending:
+            sys.stdout.write(''.join(pending))
+            pending.clear()
+        sys.stdout.flush()
+        last_flush = time.time()
+    
+    read = None
+    exited = False
     try:
-        # Run main.py
-        process = subprocess.Popen(
-            [sys.executable, "main.py"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1
-        )
-        
-        print(f"[MONITOR] Process started with PID: {process.pid}")
-        
         # Monitor output in real-time
         while True:
-            if timeout_occurred.is_set():
-                print("[TIMEOUT] Timeout occurred, exiting...")
-                return 1
-                
-            output = process.stdout.readline()
-            if output == '' and process.poll() is not None:
+            if read is None:
+                read = asyncio.ensure_future(process.stdout.readline())
+            
+            # Wake for whichever comes first: the next line, the flush
+            # interval of buffered lines or the startup deadline
+            now = time.time()
+            wait = None
+            if pending:
+                wait = _FLUSH_INTERVAL - (now - last_flush)
+            if not started:
+                remaining = timeout_seconds - (now - start_time)
+                wait = remaining if wait is None else min(wait, remaining)
+            
+            done, _ = await asyncio.wait({read}, timeout=None if wait is None else max(wait, 0))
+            
+            if not done:
+                flush()
+                if not started and time.time() - start_time >= timeout_seconds:
+                    print(f"\n[TIMEOUT] Process exceeded {timeout_seconds}s, terminating...")
+                    await _terminate(process)
+                    print("[TIMEOUT] Timeout occurred, exiting...")
+                    return 1
+                continue
+            
+            output = read.result()
+            read = None
+            if not output:
                 break
-            if output:
-                elapsed = time.time() - start_time
-                print(f"[{elapsed:.1f}s] {output.strip()}")
-                
-                # Check for successful startup indicators
-                if "Uvicorn running on" in output or "Application startup complete" in output:
-                    print(f"[SUCCESS] Server started successfully in {elapsed:.1f}s")
-                    timeout_timer.cancel()  # Cancel timeout
-                    break
+            
+            elapsed = time.time() - start_time
+            pending.append(f"[{elapsed:.1f}s] {output.strip().decode('utf-8', 'replace')}\n")
+            
+            # Check for successful startup indicators
+            if not started and _START_RE.search(output):
+                flush()
+                print(f"[SUCCESS] Server started successfully in {elapsed:.1f}s")
+                started = True
+            elif (len(pending) >= _FLUSH_LINES or _URGENT_RE.search(output)
+                  or time.time() - last_flush >= _FLUSH_INTERVAL):
+                flush()
+        
+        flush()
         
         # Wait for process to complete
-        return_code = process.wait()
+        return_code = await process.wait()
+        exited = True
         elapsed = time.time() - start_time
         
         if return_code == 0:
@@ -76,16 +125,28 @@ def run_with_timeout(timeout_seconds=30):
             
         return return_code
         
-    except KeyboardInterrupt:
-        print(f"\n[INTERRUPT] User interrupted after {time.time() - start_time:.1f}s")
-        if process:
-            process.terminate()
-        return 1
-    except Exception as e:
-        print(f"[ERROR] Exception occurred: {e}")
-        return 1
+    except asyncio.CancelledError:
+        # Ctrl+C: asyncio.run cancels this task before raising KeyboardInterrupt
+        flush()
+        raise
     finally:
-        timeout_timer.cancel()
+        if read is not None:
+            read.cancel()
+        if not exited:
+            # Timeout, Ctrl+C or a read error: never leave main.py running
+            # unsupervised
+            await _terminate(process)
+
+async def _terminate(process):
+    """Terminate the child, killing it if it has not exited within 5s"""
+    if process.returncode is not None:
+        return
+    process.terminate()
+    try:
+        await asyncio.wait_for(process.wait(), 5)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
 
 if __name__ == "__main__":
     # Default timeout: 30 seconds (20% threshold of expected 25s startup)
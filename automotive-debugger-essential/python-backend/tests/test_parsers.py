@@ -0,0 +1,408 @@
+"""
+Equivalence tests for the parser fast paths
+"""
+
+import re
+import struct
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from parsers.can_parser import CANParser
+from parsers.lin_parser import LINParser, LINMessage
+from parsers import dbc_parser
+from parsers.dbc_parser import DBCParser, cantools_message
+from parsers.uds_parser import UDSParser
+from parsers.pcap_parser import PCAPParser, _classify
+
+# Mixed-format CAN log with edge lines: odd-length payloads, empty payloads,
+# J1939 IDs that also match SocketCAN, headers, comments and garbage
+CAN_LINES = [
+    '(1.000000) can0 123#DEADBEEF',
+    '(1.000100) can0 18FEF100#0102030405060708',
+    '(1.000200) vcan_1 7FF#',
+    '(1.000300) can0 123#ABC',
+    '(1.000400)  can0  1A2#0011',
+    '(1.000500) can0 123#00GG',
+    '1.000600 1 1A2 Rx d 2 01 02',
+    '1.000700 2 18FEF100x Tx d 8 01 02 03 04 05 06 07 08',
+    '1.000800 1 123 Rx d 4 01 02',
+    '1.000900,123,2,01,02',
+    '1.001,7FF,3,0A 0B 0C',
+    '2,1A2,1,FF',
+    '# comment',
+    'Time ID DLC Data',
+    'garbage line',
+    '(1.001000) can0 #0102',
+    '(1.001100)can0 123#01',
+    '',
+]
+
+def _reference_parse(parser: CANParser, lines):
+    """Baseline behaviour: every line goes through the full parse_line chain"""
+    messages = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if any(header in line.lower() for header in ['time', 'id', 'dlc', 'data', 'channel']):
+            continue
+        try:
+            message = parser.parse_line(line)
+        except Exception:
+            continue
+        if message:
+            messages.append(message)
+    return messages
+
+class TestCANParserEquivalence:
+    """Per-format dispatch must agree with the parse_line fallback chain"""
+
+    @pytest.mark.parametrize('first_line', [
+        '(0.5) can0 100#01',
+        '(0.5) can0 18FEF100#01',
+        '0.5 1 100 Rx d 1 01',
+        '0.5,100,1,01',
+    ])
+    def test_dispatch_matches_fallback(self, tmp_path, first_line):
+        lines = [first_line] + CAN_LINES
+        log_file = tmp_path / 'mixed.log'
+        log_file.write_text('\n'.join(lines) + '\n')
+
+        parser = CANParser()
+        fast = [msg for chunk in parser.parse_file(str(log_file), chunk_size=4) for msg in chunk]
+
+        assert parser.current_format is not None
+        assert fast == _reference_parse(CANParser(), lines)
+
+    def test_socketcan_scanner_matches_regex(self):
+        parser = CANParser()
+        for line in CAN_LINES + ['(1.0) can0 123#0102 trailing', '(.5) can0 1#01', '(1.) can0 1#01']:
+            try:
+                expected = parser._parse_socketcan(line)
+            except ValueError:
+                with pytest.raises(ValueError):
+                    parser._parse_socketcan_scan(line)
+                continue
+            assert parser._parse_socketcan_scan(line) == expected
+
+# LIN lines around the edges of the "LIN <timestamp> <id> <hex>" layout
+LIN_LINES = [
+    'LIN 1.500000 12 0102030405060708',
+    'LIN 1.600000 12 0102',
+    '   LIN 1.700000 3 ab  ',
+    'LIN 1.5 12 01GG',
+    'LIN 1.5 12 0102;',
+    'LIN 1.5 12 ABC',
+    'LIN 1.5\t12\t0A0B',
+    'LIN 1 12 0102',
+    'LIN nan 12 0102',
+    'LIN inf -3 0102',
+    'LIN 1_0.5 1_2 ab',
+    'LIN 1.5 12',
+    'LIN1.5 12 0102',
+    'XLIN 1.5 12 0102',
+    '# LIN 1.5 12 0102',
+    '',
+]
+
+# Baseline LIN line parser the fast path must agree with
+_BASELINE_LIN_RE = re.compile(r'LIN\s+(\d+\.\d+)\s+(\d+)\s+([0-9A-Fa-f]+)')
+
+def _baseline_lin(line: str):
+    match = _BASELINE_LIN_RE.match(line)
+    if not match:
+        return None
+    try:
+        data = bytes.fromhex(match.group(3))
+    except ValueError:
+        return None
+    return LINMessage(timestamp=float(match.group(1)), frame_id=int(match.group(2)),
+                      data=data, checksum=0)
+
+class TestLINParserEquivalence:
+    """LIN parsing must accept exactly the lines the baseline regex accepts"""
+
+    @pytest.fixture
+    def lin_file(self, tmp_path):
+        log_file = tmp_path / 'edge.lin'
+        log_file.write_bytes('\r\n'.join(LIN_LINES).encode())
+        return log_file
+
+    def test_parse_file_matches_baseline(self, lin_file):
+        expected = [_baseline_lin(line.strip()) for line in LIN_LINES]
+        expected = [msg for msg in expected if msg is not None]
+
+        parsed = [msg for chunk in LINParser().parse_file(str(lin_file), chunk_size=2) for msg in chunk]
+
+        assert parsed == expected
+        assert len(parsed) == 6
+
+    def test_stats_scan_matches_detailed(self, lin_file):
+        parser = LINParser()
+
+        assert parser.get_file_stats(str(lin_file)) == parser.get_file_stats(str(lin_file), detailed=True)
+        assert parser.get_file_stats(str(lin_file))['total_messages'] == 6
+
+# Intel and Motorola, signed and unsigned, clamped, enumerated and wider than
+# 53 bits (which the vectorized paths hand back to the scalar decoder)
+DBC_TEXT = '''VERSION ""
+
+NS_ :
+
+BS_:
+
+BU_: ECU1 ECU2
+
+BO_ 100 EngineData: 8 ECU1
+ SG_ RPM : 0|16@1+ (0.25,0) [0|16383.75] "rpm" ECU2
+ SG_ Temp : 16|8@1- (1,-40) [-40|215] "degC" ECU2
+ SG_ Gear : 24|4@1+ (1,0) [0|0] "" ECU2
+ SG_ MotoSig : 39|12@0+ (0.5,10) [0|0] "km/h" ECU2
+ SG_ MotoSigned : 55|10@0- (1,0) [0|0] "" ECU2
+
+BO_ 2147484000 ExtMsg: 8 ECU2
+ SG_ Wide : 0|56@1+ (1,0) [0|0] "" ECU1
+ SG_ Odd : 63|3@0+ (1,0) [0|0] "" ECU1
+
+BA_DEF_ BO_ "GenMsgCycleTime" INT 0 10000;
+BA_ "GenMsgCycleTime" BO_ 100 100;
+VAL_ 100 Gear 0 "Neutral" 1 "First" 2 "Second" ;
+'''
+
+class TestDBCDecodeEquivalence:
+    """Vectorized and JIT decode paths must match the per-signal manual decode"""
+
+    @pytest.fixture
+    def dbc(self, tmp_path):
+        dbc_file = tmp_path / 'test.dbc'
+        dbc_file.write_text(DBC_TEXT)
+        parser = DBCParser()
+        parser.parse_file(str(dbc_file))
+        return parser
+
+    @pytest.fixture
+    def frames(self):
+        rng = np.random.default_rng(0)
+        ids = rng.choice([100, 2147484000 & 0x1FFFFFFF, 7], size=300).astype(np.uint32)
+        payloads = rng.integers(0, 256, size=(300, 8), dtype=np.uint8)
+        payloads[:4] = np.array([0x00, 0xFF, 0x80, 0x7F], dtype=np.uint8)[:, None]
+        return ids, payloads
+
+    @pytest.mark.skipif(dbc_parser._extract_bits_native is None, reason="numba not installed")
+    def test_native_bit_extraction_matches_python(self, frames):
+        _, payloads = frames
+        for row in payloads[:50]:
+            data = row.tobytes()
+            for little_endian in (True, False):
+                for start_bit in range(0, 64, 5):
+                    for size in (1, 3, 8, 13, 32, 63):
+                        expected = dbc_parser._extract_bits(data, start_bit, size, little_endian)
+                        assert dbc_parser._extract_bits_native(row, start_bit, size, little_endian) == expected
+
+    @pytest.mark.parametrize('width', [8, 3])
+    def test_decode_message_vec_matches_manual(self, dbc, frames, width):
+        ids, payloads = frames
+        for can_id, row in zip(ids.tolist(), payloads):
+            data = row[:width].tobytes()
+            message = dbc.messages.get(can_id)
+            expected = dbc._decode_manual(message, data) if message else None
+            assert dbc.decode_message_vec(can_id, data) == expected
+
+    @pytest.mark.parametrize('width', [8, 6, 12])
+    def test_decode_frames_matches_manual(self, dbc, frames, width):
+        ids, payloads = frames
+        if width > 8:
+            payloads = np.hstack([payloads, np.full((len(ids), width - 8), 0xAA, dtype=np.uint8)])
+        else:
+            payloads = payloads[:, :width]
+
+        batches = dbc.decode_frames(ids, payloads)
+
+        decoded_rows = 0
+        for name, batch in batches.items():
+            columns = batch.to_pydict() if hasattr(batch, 'to_pydict') else {k: list(v) for k, v in batch.items()}
+            decoded_rows += len(columns['_frame_index'])
+            for position, frame_index in enumerate(columns['_frame_index']):
+                expected = dbc._decode_manual(dbc.messages[int(ids[frame_index])], payloads[frame_index].tobytes())
+                assert expected['message_name'] == name
+                for signal_name, decoded in expected['signals'].items():
+                    assert columns[signal_name][position] == decoded['value']
+        assert decoded_rows == int(np.isin(ids, list(dbc.messages)).sum())
+
+    def test_manual_fallback_matches_cantools(self, dbc, tmp_path):
+        dbc_file = tmp_path / 'test.dbc'
+        fallback = DBCParser()
+        fallback._manual_parse(dbc_file)
+
+        assert fallback.nodes == ['ECU1', 'ECU2']
+        assert fallback.nodes == [node.name for node in dbc.db.nodes]
+        assert sorted(m.name for m in fallback.messages.values()) == sorted(m.name for m in dbc.messages.values())
+        assert sorted(fallback.signals) == sorted(dbc.signals)
+
+    def test_concurrent_loads_restore_cantools(self, tmp_path):
+        original = cantools_message.create_encode_decode_formats
+        paths = []
+        for i in range(8):
+            dbc_file = tmp_path / f'copy{i}.dbc'
+            dbc_file.write_text(DBC_TEXT)
+            paths.append(str(dbc_file))
+
+        def load(path):
+            parser = DBCParser()
+            parser.parse_file(path)
+            return sorted(parser.signals)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(load, paths))
+
+        assert cantools_message.create_encode_decode_formats is original
+        assert all(result == results[0] for result in results)
+
+    def test_cached_parse_is_not_shared_with_callers(self, tmp_path):
+        dbc_file = tmp_path / 'shared.dbc'
+        dbc_file.write_text(DBC_TEXT)
+
+        first = DBCParser()
+        result = first.parse_file(str(dbc_file))
+        result['nodes'].append('Intruder')
+        result['value_tables']['EngineData.Gear'][7] = 'Reverse'
+        result['signals']['EngineData.RPM']['receivers'].append('Intruder')
+        first.nodes.append('Intruder')
+        first.value_tables['EngineData.Gear'][8] = 'Park'
+        first.attributes['Injected'] = {}
+        with pytest.raises(TypeError):
+            first.messages[1] = None
+        with pytest.raises(TypeError):
+            first.signals['Injected'] = None
+
+        again = DBCParser().parse_file(str(dbc_file))
+
+        assert 'Intruder' not in again['nodes']
+        assert 7 not in again['value_tables']['EngineData.Gear']
+        assert 8 not in again['value_tables']['EngineData.Gear']
+        assert 'Injected' not in again['attributes']
+        assert again['signals']['EngineData.RPM']['receivers'] == ['ECU2']
+
+    def test_lazy_view_requires_build(self):
+        class IncompleteView(dbc_parser._LazyView):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteView({})
+
+    def test_decode_frames_rejects_flat_payloads(self, dbc):
+        with pytest.raises(ValueError):
+            dbc.decode_frames(np.full(8, 100, dtype=np.uint32), np.zeros(8, dtype=np.uint8))
+
+UDS_LINES = [
+    '# UDS 1.0 A -> B 10',
+    '',
+    '  UDS 1.5 Tester -> ECU 22F190 junk',
+    'UDS 2.0 T -> E',
+    'foo UDS 3.0 A -> B 10',
+    'UDS 4.0 A -> B 1003\r',
+    'UDS 5 A -> B 10',
+    'UDS 6.0\tA\t->\tB\t7F2231',
+    'UDS 7.0 A -> B 50GG',
+    'UDS 8.0 A ->B 10',
+]
+
+class TestUDSParserEquivalence:
+    """The mmap finditer scan must match line-by-line parse_line"""
+
+    @pytest.fixture
+    def uds_file(self, tmp_path):
+        log_file = tmp_path / 'edge.uds'
+        log_file.write_bytes(('\n'.join(UDS_LINES * 3) + '\n').encode())
+        return log_file
+
+    def test_parse_file_matches_parse_line(self, uds_file):
+        parser = UDSParser()
+        expected = [parser.parse_line(line.strip()) for line in UDS_LINES * 3]
+        expected = [msg for msg in expected if msg is not None]
+
+        parsed = [msg for chunk in parser.parse_file(str(uds_file), chunk_size=4) for msg in chunk]
+
+        assert parsed == expected
+        assert len(parsed) == 12
+
+    def test_arrays_match_messages(self, uds_file):
+        parser = UDSParser()
+        messages = [msg for chunk in parser.parse_file(str(uds_file)) for msg in chunk]
+
+        full = list(parser.parse_file_arrays(str(uds_file), chunk_size=5))
+        services_only = list(parser.parse_file_arrays(str(uds_file), chunk_size=5, payloads=False))
+
+        assert [t for chunk in full for t in chunk[0].tolist()] == [m.timestamp for m in messages]
+        assert [s for chunk in full for s in chunk[1].tolist()] == [m.service_id for m in messages]
+        assert [p for chunk in full for p in chunk[2]] == [m.data for m in messages]
+        assert [(t.tolist(), s.tolist()) for t, s, _ in services_only] == [(t.tolist(), s.tolist()) for t, s, _ in full]
+
+    def test_odd_length_payload_raises_on_every_path(self, tmp_path):
+        log_file = tmp_path / 'odd.uds'
+        log_file.write_text('UDS 1.0 A -> B 10\nUDS 2.0 A -> B 1\n')
+        parser = UDSParser()
+
+        with pytest.raises(ValueError):
+            parser.parse_line('UDS 2.0 A -> B 1')
+        with pytest.raises(ValueError):
+            list(parser.parse_file(str(log_file)))
+        with pytest.raises(ValueError):
+            list(parser.parse_file_arrays(str(log_file), payloads=False))
+
+# Ethernet + IPv4 header carrying UDP, and an ARP frame
+_UDP_FRAME = bytes(12) + b'\x08\x00' + b'\x45' + bytes(8) + b'\x11' + bytes(10)
+_ARP_FRAME = bytes(12) + b'\x08\x06' + bytes(28)
+
+def _build_pcap(byte_order: str, magic: int, records, trailing: bytes = b'') -> bytes:
+    """Hand-built classic PCAP: global header, then (sec, frac, packet) records"""
+    data = struct.pack(f'{byte_order}IHHiIII', magic, 2, 4, 0, 0, 65535, 1)
+    for ts_sec, ts_frac, packet in records:
+        data += struct.pack(f'{byte_order}IIII', ts_sec, ts_frac, len(packet), len(packet)) + packet
+    return data + trailing
+
+class TestPCAPParser:
+    """Classic PCAP record walk over mmap"""
+
+    @pytest.mark.parametrize('byte_order,magic,unit', [
+        ('<', 0xA1B2C3D4, 1e-6),
+        ('>', 0xA1B2C3D4, 1e-6),
+        ('<', 0xA1B23C4D, 1e-9),
+    ])
+    def test_records_and_truncated_tail(self, tmp_path, byte_order, magic, unit):
+        # The trailing record header promises 100 bytes but only 10 follow
+        truncated = struct.pack(f'{byte_order}IIII', 12, 0, 100, 100) + bytes(10)
+        pcap_file = tmp_path / 'capture.pcap'
+        pcap_file.write_bytes(_build_pcap(byte_order, magic,
+                                          [(10, 500, _UDP_FRAME), (11, 250, _ARP_FRAME)], truncated))
+        parser = PCAPParser()
+
+        messages = [msg for chunk in parser.parse_file(str(pcap_file)) for msg in chunk]
+
+        assert parser.validate_format(pcap_file)
+        assert [msg.protocol for msg in messages] == ['UDP', 'ARP']
+        assert [msg.data for msg in messages] == [_UDP_FRAME, _ARP_FRAME]
+        assert messages[0].timestamp == pytest.approx(10 + 500 * unit)
+        assert messages[1].timestamp == pytest.approx(11 + 250 * unit)
+
+        stats = parser.get_file_stats(str(pcap_file))
+        assert stats['total_messages'] == 2
+        assert stats['protocols'] == {'UDP': 1, 'ARP': 1}
+        assert stats['time_range']['start'] == messages[0].timestamp
+
+    def test_short_and_foreign_files_yield_nothing(self, tmp_path):
+        short = tmp_path / 'short.pcap'
+        short.write_bytes(b'\xd4\xc3\xb2\xa1')
+        pcapng = tmp_path / 'capture.pcapng'
+        pcapng.write_bytes(b'\x0a\x0d\x0d\x0a' + bytes(40))
+
+        assert list(PCAPParser().parse_file(str(short))) == []
+        assert list(PCAPParser().parse_file(str(pcapng))) == []
+
+    def test_classify(self):
+        assert _classify(1, _UDP_FRAME) == 'UDP'
+        assert _classify(1, _UDP_FRAME[:20]) == 'IPv4'
+        assert _classify(1, _ARP_FRAME) == 'ARP'
+        assert _classify(1, bytes(10)) == 'Ethernet'
+        assert _classify(227, b'') == 'CAN'
+        assert _classify(999, b'') == 'LINKTYPE_999'
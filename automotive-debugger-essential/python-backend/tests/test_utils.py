@@ -5,10 +5,14 @@ Tests for utility modules
 import pytest
 import tempfile
 import os
+from datetime import datetime, timezone
+from enum import Enum
 from typing import Dict, Any
-from utils.csv_exporter import CSVExporter
+from utils import csv_exporter
+from utils.csv_exporter import CSVExporter, _cell
 from utils.html_exporter import HTMLExporter
 from utils.pdf_exporter import PDFExporter
+from utils.file_utils import get_file_hash
 
 class TestExporters:
     """Test export utility classes"""
@@ -66,6 +70,40 @@ class TestExporters:
         assert 'bus_load' in csv_content
         assert 'Timeline Data' in csv_content
 
+    @pytest.mark.asyncio
+    async def test_csv_exporter_stream(self, sample_analysis_data):
+        """Test streamed CSV export matches the one-shot export"""
+        exporter = CSVExporter()
+        sections = ['errors', 'patterns', 'timeline', 'statistics']
+
+        chunks = [
+            chunk async for chunk in exporter.export_stream(sample_analysis_data, sections, rows_per_chunk=2)
+        ]
+
+        assert len(chunks) > 1
+        assert all(isinstance(chunk, bytes) for chunk in chunks)
+        assert b''.join(chunks).decode() == await exporter.export(sample_analysis_data, sections)
+
+    def test_csv_cell_json_fallback(self, monkeypatch):
+        """orjson and json render the same cells, including what orjson rejects"""
+        class Level(Enum):
+            HIGH = 'high'
+
+        values = [
+            {'big': 1 << 70, 'neg': -(1 << 65)},
+            {(0x123, 'rx'): 1, 0x7DF: [2, 3]},
+            {'at': datetime(2025, 1, 14, 10, 0, 0, 250, tzinfo=timezone.utc), 'level': Level.HIGH},
+            [datetime(2025, 1, 14), {'nested': {(1, 2): 1 << 64}}],
+        ]
+        fast = [_cell(value) for value in values]
+        monkeypatch.setattr(csv_exporter, 'orjson', None)
+        slow = [_cell(value) for value in values]
+
+        assert fast == slow
+        assert fast[0] == '{"big":%d,"neg":%d}' % (1 << 70, -(1 << 65))
+        assert fast[1] == '{"(291, \'rx\')":1,"2015":[2,3]}'
+        assert fast[2] == '{"at":"2025-01-14T10:00:00.000250+00:00","level":"high"}'
+
     @pytest.mark.asyncio
     async def test_html_exporter(self, sample_analysis_data):
         """Test HTML exporter functionality"""
@@ -118,4 +156,20 @@ class TestExporters:
         html_content = await exporter.export(sample_analysis_data, ['errors'])
 
         assert 'Errors Detected' in html_content
-        assert 'Patterns Analysis' not in html_content
\ No newline at end of file
+        assert 'Patterns Analysis' not in html_content
+
+class TestFileUtils:
+    """Test file utility functions"""
+
+    def test_file_hash_is_blake3(self, tmp_path):
+        """File IDs are BLAKE3 digests regardless of environment"""
+        blake3 = pytest.importorskip('blake3')
+        data = os.urandom(4096)
+        path = tmp_path / 'upload.bin'
+        path.write_bytes(data)
+
+        assert get_file_hash(str(path)) == blake3.blake3(data).hexdigest()
+
+        empty = tmp_path / 'empty.bin'
+        empty.write_bytes(b'')
+        assert get_file_hash(str(empty)) == blake3.blake3(b'').hexdigest()
\ No newline at end of file
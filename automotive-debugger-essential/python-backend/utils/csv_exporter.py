@@ -5,11 +5,52 @@ Exports analysis results to CSV format
 
 import logging
 import csv
-from typing import Dict, List, Any
+import json
+from datetime import date, time
+from enum import Enum
+from typing import Dict, List, Any, AsyncGenerator, Iterator
 from io import StringIO
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+def _json_default(value: Any) -> Any:
+    """Render types JSON lacks the way orjson does natively, so both paths agree"""
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+def _json_keys(value: Any) -> Any:
+    """Copy of value with dict keys json.dumps rejects (tuples, dates...) stringified"""
+    if isinstance(value, dict):
+        return {
+            key if key is None or isinstance(key, (str, int, float, bool)) else _json_default(key): _json_keys(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_json_keys(item) for item in value]
+    return value
+
+def _cell(value: Any) -> str:
+    """Stringify a value for a CSV cell; containers become JSON text"""
+    if isinstance(value, (int, float, str, bool)):
+        return str(value)
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            # Ints wider than 64 bits or keys such as tuples; json handles both
+            pass
+    try:
+        return json.dumps(value, default=_json_default, ensure_ascii=False, separators=(',', ':'))
+    except TypeError:
+        return json.dumps(_json_keys(value), default=_json_default, ensure_ascii=False, separators=(',', ':'))
+
 class CSVExporter:
     """Export analysis results to CSV format"""
 
@@ -33,61 +74,7 @@ class CSVExporter:
 
             output = StringIO()
             writer = csv.writer(output)
-
-            # Write header
-            writer.writerow(['Section', 'Type', 'Description', 'Timestamp', 'Severity'])
-
-            results = analysis_data.get('results', {})
-
-            # Export errors section
-            if 'errors' in include_sections:
-                errors = results.get('errors', [])
-                for error in errors:
-                    if isinstance(error, dict):
-                        writer.writerow([
-                            'Errors',
-                            error.get('type', 'Unknown'),
-                            error.get('description', 'N/A'),
-                            error.get('timestamp', 'N/A'),
-                            error.get('severity', 'N/A')
-                        ])
-                    else:
-                        writer.writerow(['Errors', 'Error', str(error), 'N/A', 'N/A'])
-
-            # Export patterns section
-            if 'patterns' in include_sections:
-                patterns = results.get('patterns', {})
-                for pattern_name, pattern_data in patterns.items():
-                    writer.writerow([
-                        'Patterns',
-                        pattern_name,
-                        str(pattern_data),
-                        'N/A',
-                        'Info'
-                    ])
-
-            # Export timeline section
-            if 'timeline' in include_sections:
-                timeline = results.get('timeline', {})
-                writer.writerow([
-                    'Timeline',
-                    'Timeline Data',
-                    f"Events: {len(timeline.get('events', []))}",
-                    'N/A',
-                    'Info'
-                ])
-
-            # Export statistics section
-            if 'statistics' in include_sections:
-                stats = results.get('statistics', {})
-                for stat_name, stat_value in stats.items():
-                    writer.writerow([
-                        'Statistics',
-                        stat_name,
-                        str(stat_value),
-                        'N/A',
-                        'Info'
-                    ])
+            writer.writerows(self._iter_rows(analysis_data, include_sections))
 
             csv_content = output.getvalue()
             output.close()
@@ -96,4 +83,106 @@ class CSVExporter:
 
         except Exception as e:
             logger.error(f"Error exporting CSV: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    async def export_stream(self, analysis_data: Dict[str, Any], include_sections: List[str],
+                            rows_per_chunk: int = 1000) -> AsyncGenerator[bytes, None]:
+        """
+        Export analysis data to CSV format, yielding encoded chunks
+
+        Args:
+            analysis_data: Analysis results dictionary
+            include_sections: List of sections to include in export
+            rows_per_chunk: Number of rows encoded into each yielded chunk
+
+        Yields:
+            UTF-8 encoded CSV content, suitable for a StreamingResponse
+        """
+        try:
+            logger.info(f"Streaming CSV with sections: {include_sections}")
+
+            buffer = _ChunkBuffer()
+            writer = csv.writer(buffer)
+
+            for row_count, row in enumerate(self._iter_rows(analysis_data, include_sections), 1):
+                writer.writerow(row)
+                if row_count % rows_per_chunk == 0:
+                    yield buffer.drain()
+
+            if buffer.chunks:
+                yield buffer.drain()
+
+        except Exception as e:
+            logger.error(f"Error exporting CSV: {e}")
+            raise
+
+    def _iter_rows(self, analysis_data: Dict[str, Any], include_sections: List[str]) -> Iterator[List[Any]]:
+        """Yield the CSV rows (header first) for the included sections"""
+        # Write header
+        yield ['Section', 'Type', 'Description', 'Timestamp', 'Severity']
+
+        results = analysis_data.get('results', {})
+
+        # Export errors section
+        if 'errors' in include_sections:
+            errors = results.get('errors', [])
+            for error in errors:
+                if isinstance(error, dict):
+                    yield [
+                        'Errors',
+                        error.get('type', 'Unknown'),
+                        error.get('description', 'N/A'),
+                        error.get('timestamp', 'N/A'),
+                        error.get('severity', 'N/A')
+                    ]
+                else:
+                    yield ['Errors', 'Error', str(error), 'N/A', 'N/A']
+
+        # Export patterns section
+        if 'patterns' in include_sections:
+            patterns = results.get('patterns', {})
+            for pattern_name, pattern_data in patterns.items():
+                yield [
+                    'Patterns',
+                    pattern_name,
+                    _cell(pattern_data),
+                    'N/A',
+                    'Info'
+                ]
+
+        # Export timeline section
+        if 'timeline' in include_sections:
+            timeline = results.get('timeline', {})
+            yield [
+                'Timeline',
+                'Timeline Data',
+                f"Events: {len(timeline.get('events', []))}",
+                'N/A',
+                'Info'
+            ]
+
+        # Export statistics section
+        if 'statistics' in include_sections:
+            stats = results.get('statistics', {})
+            for stat_name, stat_value in stats.items():
+                yield [
+                    'Statistics',
+                    stat_name,
+                    _cell(stat_value),
+                    'N/A',
+                    'Info'
+                ]
+
+class _ChunkBuffer:
+    """Minimal csv.writer target that collects written rows until drained"""
+
+    def __init__(self):
+        self.chunks: List[str] = []
+
+    def write(self, s: str) -> None:
+        self.chunks.append(s)
+
+    def drain(self) -> bytes:
+        data = "".join(self.chunks).encode()
+        self.chunks.clear()
+        return data
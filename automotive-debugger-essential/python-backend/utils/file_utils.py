@@ -4,51 +4,84 @@ Handles file operations for the application
 """
 
 import os
+import mmap
 import hashlib
 import logging
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Tuple
 import aiofiles
+# Required, not optional: file IDs must not depend on what is installed
+import blake3
 
 logger = logging.getLogger(__name__)
 
-async def save_uploaded_file(file) -> str:
+# Files up to this size are hashed from one mmap; larger ones are streamed
+_MMAP_HASH_LIMIT = 1 << 30
+
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+def _new_file_hasher():
+    """
+    Content hasher for file IDs: always BLAKE3 (SIMD, multithreaded), so the
+    same upload gets the same 64-character ID in every environment
+    """
+    return blake3.blake3(max_threads=blake3.blake3.AUTO)
+
+async def save_uploaded_file(file) -> Tuple[str, str]:
     """
     Save uploaded file to disk
+    
+    The upload is streamed to a temporary file in 1 MiB chunks and hashed in
+    the same pass, then renamed to its content hash. Returns (file path,
+    content hash); the hash matches get_file_hash() of the saved file.
     """
+    # Create uploads directory
+    upload_dir = Path("uploads")
+    upload_dir.mkdir(exist_ok=True)
+    
+    fd, tmp_name = tempfile.mkstemp(dir=upload_dir, suffix=".part")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    
     try:
-        # Create uploads directory
-        upload_dir = Path("uploads")
-        upload_dir.mkdir(exist_ok=True)
-        
-        # Generate unique filename
-        file_hash = hashlib.md5(file.filename.encode()).hexdigest()
-        file_extension = Path(file.filename).suffix
-        unique_filename = f"{file_hash}{file_extension}"
-        file_path = upload_dir / unique_filename
-        
         # Save file
-        async with aiofiles.open(file_path, 'wb') as f:
-            content = await file.read()
-            await f.write(content)
+        hasher = _new_file_hasher()
+        async with aiofiles.open(tmp_path, 'wb') as f:
+            while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+                hasher.update(chunk)
+                await f.write(chunk)
+        
+        file_hash = hasher.hexdigest()
+        file_path = upload_dir / f"{file_hash}{Path(file.filename).suffix}"
+        os.replace(tmp_path, file_path)
         
         logger.info(f"File saved: {file_path}")
-        return str(file_path)
+        return str(file_path), file_hash
         
     except Exception as e:
         logger.error(f"Error saving file: {e}")
+        tmp_path.unlink(missing_ok=True)
         raise
 
 def get_file_hash(file_path: str) -> str:
     """
-    Calculate MD5 hash of file
+    Calculate the BLAKE3 content hash of a file
     """
     try:
-        hash_md5 = hashlib.md5()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            size = os.fstat(f.fileno()).st_size
+            
+            if size > _MMAP_HASH_LIMIT:
+                return hashlib.file_digest(f, _new_file_hasher).hexdigest()
+            
+            hasher = _new_file_hasher()
+            if size:  # mmap refuses empty files
+                # One update over the whole mapping: the C digest loop runs
+                # without the GIL and without per-block read() calls
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+        return hasher.hexdigest()
     except Exception as e:
         logger.error(f"Error calculating file hash: {e}")
         return ""
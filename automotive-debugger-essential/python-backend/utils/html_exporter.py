@@ -4,35 +4,56 @@ Exports analysis results to HTML format
 """
 
 import logging
+import functools
 from typing import Dict, List, Any
 from datetime import datetime
+try:
+    from jinja2 import Environment, DictLoader, select_autoescape
+except ImportError:
+    Environment = None
 
 logger = logging.getLogger(__name__)
 
-class HTMLExporter:
-    """Export analysis results to HTML format"""
-
-    def __init__(self):
-        """Initialize HTML exporter"""
-        pass
-
-    async def export(self, analysis_data: Dict[str, Any], include_sections: List[str]) -> str:
-        """
-        Export analysis data to HTML format
-
-        Args:
-            analysis_data: Analysis results dictionary
-            include_sections: List of sections to include in export
+# Section templates, compiled once per process when Jinja2 is available
+_SECTION_TEMPLATES = {
+    'errors.html': """
+            <div class="section">
+                <h2>Errors Detected</h2>
+                {% for error in errors %}<div class="error">• {{ error }}</div>{% endfor %}
+            </div>
+            """,
+    'patterns.html': """
+            <div class="section">
+                <h2>Patterns Analysis</h2>
+                <pre>{{ patterns }}</pre>
+            </div>
+            """,
+    'timeline.html': """
+            <div class="section">
+                <h2>Timeline Data</h2>
+                <p>Timeline visualization data available</p>
+            </div>
+            """,
+    'section.html': """
+            <div class="section">
+                <h2>{{ title }}</h2>
+                <p>Section data available</p>
+            </div>
+            """,
+}
 
-        Returns:
-            HTML content as string
-        """
-        try:
-            logger.info(f"Exporting HTML with sections: {include_sections}")
+if Environment is not None:
+    _env = Environment(
+        loader=DictLoader(_SECTION_TEMPLATES),
+        autoescape=select_autoescape(['html']),
+        cache_size=-1,
+        keep_trailing_newline=True
+    )
+else:
+    _env = None
 
-            # Generate HTML content
-            html_content = f"""
-            <!DOCTYPE html>
+# Report page around the sections; only the placeholders change per export
+_HTML_SHELL = """<!DOCTYPE html>
             <html>
             <head>
                 <title>Automotive Analysis Report</title>
@@ -48,58 +69,107 @@ class HTMLExporter:
             <body>
                 <div class="header">
                     <h1>Automotive Debug Analysis Report</h1>
-                    <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+                    <p>Generated: {generated}</p>
                 </div>
 
                 <div class="section">
                     <h2>Analysis Summary</h2>
-                    <p>Analysis ID: {analysis_data.get('analysis_id', 'N/A')}</p>
-                    <p>Files Processed: {len(analysis_data.get('files', []))}</p>
+                    <p>Analysis ID: {analysis_id}</p>
+                    <p>Files Processed: {file_count}</p>
                 </div>
 
-                {''.join(self._render_section(section, analysis_data) for section in include_sections)}
+                {sections}
 
             </body>
-            </html>
-            """
+            </html>"""
 
-            return html_content.strip()
+# Same escaping as Jinja2's autoescape, for rendering without it
+_HTML_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&#34;', "'": '&#39;'})
 
-        except Exception as e:
-            logger.error(f"Error exporting HTML: {e}")
-            raise
+def _escape(value: Any) -> str:
+    return str(value).translate(_HTML_ESCAPES)
 
-    def _render_section(self, section: str, data: Dict[str, Any]) -> str:
-        """Render individual section of the report"""
-        results = data.get('results', {})
+@functools.lru_cache(maxsize=32)
+def _render_section_cached(section: str, payload: Any) -> str:
+    """
+    Render one report section from its stringified data
 
-        if section == 'errors':
-            errors = results.get('errors', [])
-            return f"""
+    A pure function of its arguments: re-exporting an analysis, e.g. with a
+    different include_sections, reuses sections that were already rendered.
+    """
+    if section == 'errors':
+        if _env is not None:
+            return _env.get_template('errors.html').render(errors=payload)
+        return f"""
             <div class="section">
                 <h2>Errors Detected</h2>
-                {''.join(f'<div class="error">• {error}</div>' for error in errors)}
+                {''.join(f'<div class="error">• {_escape(error)}</div>' for error in payload)}
             </div>
             """
-        elif section == 'patterns':
-            patterns = results.get('patterns', {})
-            return f"""
+    elif section == 'patterns':
+        if _env is not None:
+            return _env.get_template('patterns.html').render(patterns=payload)
+        return f"""
             <div class="section">
                 <h2>Patterns Analysis</h2>
-                <pre>{patterns}</pre>
+                <pre>{_escape(payload)}</pre>
             </div>
             """
-        elif section == 'timeline':
-            return f"""
+    elif section == 'timeline':
+        return _SECTION_TEMPLATES['timeline.html']
+    else:
+        if _env is not None:
+            return _env.get_template('section.html').render(title=section.title())
+        return f"""
             <div class="section">
-                <h2>Timeline Data</h2>
-                <p>Timeline visualization data available</p>
+                <h2>{_escape(section.title())}</h2>
+                <p>Section data available</p>
             </div>
             """
+
+class HTMLExporter:
+    """Export analysis results to HTML format"""
+
+    def __init__(self):
+        """Initialize HTML exporter"""
+        pass
+
+    async def export(self, analysis_data: Dict[str, Any], include_sections: List[str]) -> str:
+        """
+        Export analysis data to HTML format
+
+        Args:
+            analysis_data: Analysis results dictionary
+            include_sections: List of sections to include in export
+
+        Returns:
+            HTML content as string
+        """
+        try:
+            logger.info(f"Exporting HTML with sections: {include_sections}")
+
+            return _HTML_SHELL.format_map({
+                'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'analysis_id': analysis_data.get('analysis_id', 'N/A'),
+                'file_count': len(analysis_data.get('files', [])),
+                'sections': ''.join(self._render_section(section, analysis_data) for section in include_sections)
+            })
+
+        except Exception as e:
+            logger.error(f"Error exporting HTML: {e}")
+            raise
+
+    def _render_section(self, section: str, data: Dict[str, Any]) -> str:
+        """Render individual section of the report"""
+        results = data.get('results', {})
+
+        # Sections only ever render the str() of their data, so that text is
+        # what the render cache is keyed on
+        if section == 'errors':
+            payload = tuple(str(error) for error in results.get('errors', []))
+        elif section == 'patterns':
+            payload = str(results.get('patterns', {}))
         else:
-            return f"""
-            <div class="section">
-                <h2>{section.title()}</h2>
-                <p>Section data available</p>
-            </div>
-            """
\ No newline at end of file
+            payload = None
+
+        return _render_section_cached(section, payload)
@@ -9,25 +9,119 @@ import subprocess
 import platform
 import shutil
 import json
+import hashlib
+import argparse
+import contextlib
+import functools
+import itertools
+import threading
+import time
 import urllib.request
-import zipfile
-import tarfile
 from pathlib import Path
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Large installers are fetched as concurrent HTTP range requests
+_DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+_DOWNLOAD_WORKERS = 4
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Cached copies of URLs that always serve the newest build are re-fetched
+# once they are this old (seconds)
+_LATEST_INSTALLER_MAX_AGE = 24 * 60 * 60
+
+# Stored in app.db's user_version once its schema has been created
+_SCHEMA_VERSION = 1
+
+_OLLAMA_URL = "http://127.0.0.1:11434"
+# Stepped backoff between readiness probes; 1 s once these run out
+_OLLAMA_PROBE_DELAYS = (0.05, 0.05, 0.1, 0.1, 0.2, 0.2, 0.5, 0.5)
+
+# Fixed for the lifetime of the installer process
+_SYSTEM = platform.system()
+_MACHINE = platform.machine()
+
+@functools.lru_cache(maxsize=None)
+def _which(cmd: str) -> Optional[str]:
+    """shutil.which, memoized; clear the cache after installing a tool"""
+    return shutil.which(cmd)
+
+def _new_http_client():
+    """
+    Keep-alive connection pool shared by all downloads (HTTP/2 when h2 is
+    installed), or None without httpx: each request then opens its own
+    connection through urllib
+    """
+    if httpx is None:
+        return None
+    
+    limits = httpx.Limits(max_connections=16, max_keepalive_connections=8)
+    try:
+        return httpx.Client(http2=True, follow_redirects=True, timeout=30.0, limits=limits)
+    except ImportError:  # http2=True needs the h2 package
+        return httpx.Client(follow_redirects=True, timeout=30.0, limits=limits)
+
+class DependencyGatekeeper:
+    """
+    Remembers a fingerprint of each dependency set that installed cleanly,
+    so unchanged dependencies are not reinstalled on the next run
+    """
+    
+    def __init__(self, cache_file: Path, force: bool = False):
+        self.cache_file = cache_file
+        self.force = force
+        # The pip and npm steps run concurrently and share the cache file
+        self._lock = threading.Lock()
+        try:
+            self._digests = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            self._digests = {}
+    
+    @staticmethod
+    def fingerprint(*files: Path) -> str:
+        """sha256 over the given files plus the interpreter and platform"""
+        digest = hashlib.sha256()
+        for part in (sys.version, platform.platform(), sys.executable):
+            digest.update(part.encode() + b'\0')
+        for file in files:
+            digest.update((file.read_bytes() if file.exists() else b'') + b'\0')
+        return digest.hexdigest()
+    
+    def matches(self, name: str, digest: str) -> bool:
+        """True if name was last installed from the same fingerprint"""
+        return not self.force and self._digests.get(name) == digest
+    
+    def update(self, name: str, digest: str):
+        """Record a successful install of name"""
+        with self._lock:
+            self._digests[name] = digest
+            self.cache_file.write_text(json.dumps(self._digests, indent=2))
+
 class AutoDebuggerInstaller:
     """
     Complete installer for Automotive Debug Log Analyzer
     """
     
-    def __init__(self):
-        self.system = platform.system()
-        self.machine = platform.machine()
+    def __init__(self, force: bool = False):
+        self.system = _SYSTEM
+        self.machine = _MACHINE
         self.base_dir = Path.cwd()
         self.deps_installed = []
+        self.gatekeeper = DependencyGatekeeper(self.base_dir / '.install_cache.json', force=force)
+        # Installer executables are run one at a time, even when their
+        # downloads overlap
+        self._installer_lock = threading.Lock()
+        self._http = _new_http_client()
+        # Background `ollama pull`, started by download_llama_model
+        self._model_proc = None
         
     def run(self):
         """Main installation process"""
@@ -38,16 +132,21 @@ class AutoDebuggerInstaller:
             # Step 1: Check Python version
             self.check_python_version()
             
-            # Step 2: Install Node.js dependencies
-            self.install_node_dependencies()
-            
-            # Step 3: Install Python dependencies
-            self.install_python_dependencies()
-            
-            # Step 4: Install and setup Ollama
-            self.install_ollama()
+            # Steps 2-4: Node.js dependencies, Python dependencies and Ollama
+            # are independent, network-bound installs: run them concurrently
+            steps = [self.install_node_dependencies, self.install_python_dependencies]
+            if self.system != "Windows" and not _which('ollama'):
+                # The Linux install script (sudo) and Homebrew may prompt on
+                # the terminal: install Ollama first so the prompt isn't
+                # buried in concurrent npm/pip output
+                self.install_ollama()
+                self.deps_installed.append(self.install_ollama.__name__)
+            else:
+                steps.append(self.install_ollama)
+            self.run_parallel(steps)
             
-            # Step 5: Download Llama model
+            # Step 5: Start the Llama model download; it runs in the
+            # background while the local setup steps below proceed
             self.download_llama_model()
             
             # Step 6: Setup databases
@@ -59,12 +158,169 @@ class AutoDebuggerInstaller:
             # Step 8: Verify installation
             self.verify_installation()
             
+            # Step 9: Wait for the model download to finish
+            self.wait_for_llama_model()
+            
             logger.info("✅ Installation completed successfully!")
             logger.info("Run 'npm start' to launch the application")
             
         except Exception as e:
             logger.error(f"❌ Installation failed: {e}")
+            if self._model_proc is not None and self._model_proc.poll() is None:
+                self._model_proc.terminate()
             sys.exit(1)
+        finally:
+            if self._http is not None:
+                self._http.close()
+    
+    def run_parallel(self, steps):
+        """
+        Run independent installation steps concurrently
+        
+        All steps run to completion; the first failure is then re-raised.
+        """
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = {executor.submit(step): step.__name__ for step in steps}
+            for future in as_completed(futures):
+                future.result()
+                self.deps_installed.append(futures[future])
+    
+    def _parallel_download(self, url: str, dest: Path, sha256: Optional[str] = None,
+                           workers: int = _DOWNLOAD_WORKERS, chunk: int = _DOWNLOAD_CHUNK_SIZE) -> str:
+        """
+        Download url to dest as concurrent byte-range requests
+        
+        Each worker writes its range into the preallocated file and hands
+        the bytes back, in order, to one sha256 context, so the file is
+        hashed during the download rather than re-read afterwards. Falls
+        back to a single-stream download when the server does not accept
+        ranges, the file fits in one chunk, or a range request fails.
+        
+        Returns the sha256 of the file. If sha256 is given and does not
+        match, dest is removed and IOError is raised.
+        """
+        with self._request(url, method='HEAD') as (_, headers, url, _):
+            # url is now the redirect target, which the ranges are requested from
+            size = int(headers.get('Content-Length') or 0)
+            accepts_ranges = headers.get('Accept-Ranges', '').lower() == 'bytes'
+        
+        def fetch_range(start):
+            end = min(start + chunk, size) - 1
+            with self._request(url, headers={'Range': f'bytes={start}-{end}'}) as (status, _, _, chunks):
+                if status != 206:
+                    raise IOError(f"range request answered with HTTP {status}")
+                data = b''.join(chunks)
+            if len(data) != end + 1 - start:
+                raise IOError(f"short read for bytes {start}-{end}")
+            with open(dest, 'r+b') as f:
+                f.seek(start)
+                f.write(data)
+            return data
+        
+        if not accepts_ranges or size <= chunk:
+            digest = self._stream_download(url, dest)
+        else:
+            with open(dest, 'wb') as f:
+                f.truncate(size)
+            
+            try:
+                hasher = hashlib.sha256()
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for data in executor.map(fetch_range, range(0, size, chunk)):
+                        hasher.update(data)
+                digest = hasher.hexdigest()
+            except Exception as e:
+                logger.warning(f"Parallel download of {url} failed ({e}), retrying as a single stream")
+                digest = self._stream_download(url, dest)
+        
+        if sha256 is not None and digest != sha256.lower():
+            dest.unlink(missing_ok=True)
+            raise IOError(f"Checksum mismatch for {url}: expected {sha256}, got {digest}")
+        
+        logger.info(f"sha256 {digest}  {dest.name}")
+        return digest
+    
+    def _cached_download(self, url: str, dest: Path, sha256: Optional[str] = None,
+                         max_age: Optional[float] = None):
+        """
+        Provide the file at url as dest through the installer cache
+        
+        Downloads are kept in .installer-cache under the sha256 of their URL
+        and hardlinked to dest, so re-runs do not fetch installers again and
+        removing dest after use leaves the cached copy. --force re-downloads,
+        as does a cached copy older than max_age seconds or, when sha256 is
+        given, one that no longer matches it.
+        """
+        cache_dir = self.base_dir / '.installer-cache'
+        cached = cache_dir / hashlib.sha256(url.encode()).hexdigest()
+        
+        stale = self.gatekeeper.force or not cached.exists()
+        if not stale and max_age is not None and time.time() - cached.stat().st_mtime > max_age:
+            logger.info(f"Cached {dest.name} is older than {max_age:.0f}s, downloading again")
+            stale = True
+        if not stale and sha256 is not None and self._file_sha256(cached) != sha256.lower():
+            logger.warning(f"Cached {dest.name} does not match its sha256, downloading again")
+            stale = True
+        
+        if stale:
+            cache_dir.mkdir(exist_ok=True)
+            partial = cached.with_suffix('.part')
+            self._parallel_download(url, partial, sha256=sha256)
+            os.replace(partial, cached)
+        else:
+            logger.info(f"Using cached {dest.name}")
+        
+        dest.unlink(missing_ok=True)
+        try:
+            os.link(cached, dest)
+        except OSError:
+            shutil.copyfile(cached, dest)  # No hardlinks on this filesystem
+    
+    @staticmethod
+    def _file_sha256(path: Path) -> str:
+        """sha256 of a file, read in stream-sized chunks"""
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_STREAM_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+    
+    @contextlib.contextmanager
+    def _request(self, url: str, method: str = 'GET', headers: Optional[dict] = None):
+        """
+        Send an HTTP request, following redirects; HTTP errors raise
+        
+        Yields (status, headers, final url, body chunks), using the shared
+        httpx client when there is one and urllib otherwise.
+        """
+        if self._http is not None:
+            with self._http.stream(method, url, headers=headers) as response:
+                response.raise_for_status()
+                yield (response.status_code, response.headers, str(response.url),
+                       response.iter_bytes(_STREAM_CHUNK_SIZE))
+        else:
+            request = urllib.request.Request(url, method=method, headers=headers or {})
+            with urllib.request.urlopen(request) as response:
+                yield (response.status, response.headers, response.geturl(),
+                       iter(lambda: response.read(_STREAM_CHUNK_SIZE), b''))
+    
+    def _stream_download(self, url: str, dest: Path) -> str:
+        """Download url to dest on one connection, hashing as it goes; returns the sha256"""
+        hasher = hashlib.sha256()
+        with self._request(url) as (_, _, _, chunks), open(dest, 'wb') as f:
+            for chunk in chunks:
+                hasher.update(chunk)
+                f.write(chunk)
+        return hasher.hexdigest()
+    
+    def _published_sha256(self, sums_url: str, filename: str) -> str:
+        """Look up filename in a SHASUMS256.txt-style checksum list"""
+        with self._request(sums_url) as (_, _, _, chunks):
+            for line in b''.join(chunks).decode().splitlines():
+                fields = line.split()
+                if len(fields) == 2 and fields[1].lstrip('*') == filename:
+                    return fields[0]
+        raise IOError(f"{filename} is not listed in {sums_url}")
     
     def check_python_version(self):
         """Check if Python 3.12 is installed"""
@@ -85,41 +341,101 @@ class AutoDebuggerInstaller:
         """Install Node.js dependencies"""
         logger.info("Installing Node.js dependencies...")
         
+        digest = self.gatekeeper.fingerprint(self.base_dir / 'package.json',
+                                             self.base_dir / 'package-lock.json')
+        if self.gatekeeper.matches('npm', digest) and (self.base_dir / 'node_modules').is_dir():
+            logger.info("✓ Node.js dependencies up to date")
+            return
+        
         # Check if npm is installed
-        if not shutil.which('npm'):
+        if not _which('npm'):
             logger.error("npm not found. Please install Node.js first")
             if self.system == "Windows":
                 self.download_and_install_node_windows()
+                _which.cache_clear()
             else:
                 logger.error("Please install Node.js manually from https://nodejs.org")
                 sys.exit(1)
         
-        # Install npm packages
-        subprocess.run(['npm', 'install'], check=True, cwd=self.base_dir)
+        # Install npm packages: straight from the lock file when there is
+        # one, reusing a project-local cache before asking the registry
+        npm_command = 'ci' if (self.base_dir / 'package-lock.json').exists() else 'install'
+        subprocess.run(
+            ['npm', npm_command, '--prefer-offline', '--no-audit', '--no-fund'],
+            check=True,
+            cwd=self.base_dir,
+            env={**os.environ, 'npm_config_cache': str(self.base_dir / '.npm-cache')}
+        )
+        self.gatekeeper.update('npm', digest)
         logger.info("✓ Node.js dependencies installed")
     
     def install_python_dependencies(self):
         """Install Python dependencies"""
         logger.info("Installing Python dependencies...")
         
-        # Upgrade pip
-        subprocess.run([sys.executable, '-m', 'pip', 'install', '--upgrade', 'pip'], check=True)
-        
-        # Install requirements
         requirements_file = self.base_dir / 'python-backend' / 'requirements.txt'
+        digest = self.gatekeeper.fingerprint(requirements_file)
+        if self.gatekeeper.matches('pip', digest):
+            logger.info("✓ Python dependencies up to date")
+            return
+        
+        # Project-local HTTP/wheel cache, so re-runs do not depend on a
+        # persistent home directory
+        cache_dir = self.base_dir / '.pip-cache'
+        cache_dir.mkdir(exist_ok=True)
+        
+        pip_cmd = [
+            sys.executable, '-m', 'pip', 'install',
+            '--no-input', '--disable-pip-version-check',
+            '--cache-dir', str(cache_dir), '--prefer-binary'
+        ]
+        
+        # Upgrade pip on its own: --upgrade next to -r would also upgrade
+        # every requirement past what is already installed
+        subprocess.run(pip_cmd + ['--upgrade', 'pip'], check=True)
+        
+        # Fetch every requirement into a local wheelhouse, then install from
+        # it without touching the index; a failed download or offline
+        # install falls back to the regular online install
         if requirements_file.exists():
-            subprocess.run([
-                sys.executable, '-m', 'pip', 'install', '-r', str(requirements_file)
-            ], check=True)
+            pip_cmd += ['-r', str(requirements_file)]
+            wheel_dir = self.base_dir / '.wheelhouse'
+            if self._fill_wheelhouse(requirements_file, wheel_dir, cache_dir):
+                offline = subprocess.run(pip_cmd + ['--no-index', '--find-links', str(wheel_dir)])
+                if offline.returncode != 0:
+                    logger.warning("Offline install from the wheelhouse failed, installing from the index")
+                    subprocess.run(pip_cmd, check=True)
+            else:
+                subprocess.run(pip_cmd, check=True)
         
+        self.gatekeeper.update('pip', digest)
         logger.info("✓ Python dependencies installed")
     
+    def _fill_wheelhouse(self, requirements_file: Path, wheel_dir: Path, cache_dir: Path) -> bool:
+        """
+        `pip download` the requirements, with their dependencies, into
+        wheel_dir in one pip run, so versions are resolved together and
+        shared dependencies are fetched once; False if the download failed
+        """
+        wheel_dir.mkdir(exist_ok=True)
+        
+        logger.info(f"Downloading Python packages into {wheel_dir.name}...")
+        result = subprocess.run([
+            sys.executable, '-m', 'pip', 'download',
+            '--no-input', '--disable-pip-version-check',
+            '--cache-dir', str(cache_dir), '--prefer-binary',
+            '--dest', str(wheel_dir), '-r', str(requirements_file)
+        ], capture_output=True, text=True)
+        if result.returncode != 0:
+            logger.warning(f"pip download failed: {result.stderr.strip()[-500:]}")
+        return result.returncode == 0
+    
     def install_ollama(self):
         """Install Ollama for local LLM"""
         logger.info("Installing Ollama...")
         
         # Check if Ollama is already installed
-        if shutil.which('ollama'):
+        if _which('ollama'):
             logger.info("✓ Ollama already installed")
             return
         
@@ -129,20 +445,31 @@ class AutoDebuggerInstaller:
             self.install_ollama_mac()
         else:  # Linux
             self.install_ollama_linux()
+        
+        # The new binary is not in the cached PATH lookups yet
+        _which.cache_clear()
     
     def install_ollama_windows(self):
         """Install Ollama on Windows"""
+        installer_path = self._fetch_ollama_installer()
+        self._run_ollama_installer(installer_path)
+    
+    def _fetch_ollama_installer(self) -> Path:
+        """Download the Ollama installer for Windows"""
         logger.info("Downloading Ollama for Windows...")
         
-        # Download Ollama installer
         ollama_url = "https://ollama.ai/download/OllamaSetup.exe"
         installer_path = self.base_dir / "OllamaSetup.exe"
         
-        urllib.request.urlretrieve(ollama_url, installer_path)
-        
-        # Run installer silently
+        # Unversioned URL: always the latest release
+        self._cached_download(ollama_url, installer_path, max_age=_LATEST_INSTALLER_MAX_AGE)
+        return installer_path
+    
+    def _run_ollama_installer(self, installer_path: Path):
+        """Run a downloaded Ollama installer silently, then remove it"""
         logger.info("Installing Ollama...")
-        subprocess.run([str(installer_path), '/S'], check=True)
+        with self._installer_lock:
+            subprocess.run([str(installer_path), '/S'], check=True)
         
         # Clean up
         installer_path.unlink()
@@ -154,10 +481,10 @@ class AutoDebuggerInstaller:
         logger.info("Installing Ollama via brew...")
         
         # Check if brew is installed
-        if not shutil.which('brew'):
+        if not _which('brew'):
             logger.info("Installing Homebrew first...")
-            install_brew_cmd = '/bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"'
-            subprocess.run(install_brew_cmd, shell=True, check=True)
+            script = self._fetch_script("https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh")
+            subprocess.run(['/bin/bash', '-c', script], check=True)
         
         # Install Ollama
         subprocess.run(['brew', 'install', 'ollama'], check=True)
@@ -169,33 +496,65 @@ class AutoDebuggerInstaller:
         logger.info("Installing Ollama for Linux...")
         
         # Download and run install script
-        install_cmd = "curl -fsSL https://ollama.ai/install.sh | sh"
-        subprocess.run(install_cmd, shell=True, check=True)
+        script = self._fetch_script("https://ollama.ai/install.sh")
+        subprocess.run(['/bin/sh', '-c', script], check=True)
         
         logger.info("✓ Ollama installed successfully")
     
+    def _fetch_script(self, url: str) -> str:
+        """Download an install script in-process instead of through curl"""
+        with self._request(url) as (_, _, _, chunks):
+            return b''.join(chunks).decode()
+    
     def download_llama_model(self):
-        """Download Llama 3.2:3b model"""
+        """Start downloading the Llama 3.2:3b model in the background"""
         logger.info("Downloading Llama 3.2:3b model (this may take a while)...")
         
         try:
             # Start Ollama service if not running
             if self.system == "Windows":
-                subprocess.Popen(['ollama', 'serve'], shell=True)
+                subprocess.Popen([_which('ollama') or 'ollama', 'serve'])
             
             # Wait for service to start
-            import time
-            time.sleep(5)
+            if not self._wait_for_ollama():
+                logger.warning("Ollama service did not respond within 30s")
             
-            # Pull the model
-            subprocess.run(['ollama', 'pull', 'llama3.2:3b'], check=True)
-            
-            logger.info("✓ Llama 3.2:3b model downloaded")
+            # Pull the model; wait_for_llama_model collects the result
+            self._model_proc = subprocess.Popen(['ollama', 'pull', 'llama3.2:3b'])
             
         except Exception as e:
             logger.warning(f"Could not download model automatically: {e}")
             logger.info("Please run 'ollama pull llama3.2:3b' manually after installation")
     
+    def wait_for_llama_model(self):
+        """Wait for the model download started by download_llama_model"""
+        if self._model_proc is None:
+            return
+        
+        return_code = self._model_proc.wait()
+        if return_code == 0:
+            logger.info("✓ Llama 3.2:3b model downloaded")
+        else:
+            logger.warning(f"Could not download model automatically: ollama pull exited with code {return_code}")
+            logger.info("Please run 'ollama pull llama3.2:3b' manually after installation")
+    
+    def _wait_for_ollama(self, timeout: float = 30) -> bool:
+        """Probe the Ollama API until it answers; False if timeout expires first"""
+        deadline = time.monotonic() + timeout
+        delays = itertools.chain(_OLLAMA_PROBE_DELAYS, itertools.repeat(1.0))
+        
+        while True:
+            try:
+                with urllib.request.urlopen(f"{_OLLAMA_URL}/api/tags", timeout=0.25):
+                    return True
+            except OSError:
+                pass
+            
+            delay = next(delays)
+            if time.monotonic() + delay > deadline:
+                return False
+            time.sleep(delay)
+    
     def setup_databases(self):
         """Initialize SQLite and DuckDB databases"""
         logger.info("Setting up databases...")
@@ -207,9 +566,45 @@ class AutoDebuggerInstaller:
         # Initialize SQLite database
         import sqlite3
         conn = sqlite3.connect(db_dir / 'app.db')
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        
+        if conn.execute('PRAGMA user_version').fetchone()[0] == _SCHEMA_VERSION:
+            logger.info("✓ SQLite schema up to date")
+        else:
+            self._create_sqlite_schema(conn)
+        conn.close()
         
-        # Create tables
-        conn.executescript('''
+        # Initialize DuckDB
+        try:
+            import duckdb
+            duck_conn = duckdb.connect(str(db_dir / 'analytics.duckdb'))
+            
+            duck_conn.execute('''
+                CREATE TABLE IF NOT EXISTS can_messages (
+                    timestamp TIMESTAMP,
+                    can_id INTEGER,
+                    dlc INTEGER,
+                    data BLOB,
+                    channel INTEGER,
+                    error_flag BOOLEAN
+                )
+            ''')
+            
+            duck_conn.close()
+        except ImportError:
+            logger.warning("DuckDB not installed, skipping analytics database setup")
+        
+        logger.info("✓ Databases initialized")
+    
+    def _create_sqlite_schema(self, conn):
+        """Create the app.db tables in one transaction and stamp the schema version"""
+        # One explicit transaction (executescript would otherwise commit
+        # each statement): a single journal sync for the whole schema
+        conn.executescript(f'''
+            BEGIN IMMEDIATE;
+            
             CREATE TABLE IF NOT EXISTS analysis_history (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
@@ -239,32 +634,10 @@ class AutoDebuggerInstaller:
                 import_settings JSON,
                 last_used DATETIME
             );
-        ''')
-        
-        conn.commit()
-        conn.close()
-        
-        # Initialize DuckDB
-        try:
-            import duckdb
-            duck_conn = duckdb.connect(str(db_dir / 'analytics.duckdb'))
-            
-            duck_conn.execute('''
-                CREATE TABLE IF NOT EXISTS can_messages (
-                    timestamp TIMESTAMP,
-                    can_id INTEGER,
-                    dlc INTEGER,
-                    data BLOB,
-                    channel INTEGER,
-                    error_flag BOOLEAN
-                )
-            ''')
             
-            duck_conn.close()
-        except ImportError:
-            logger.warning("DuckDB not installed, skipping analytics database setup")
-        
-        logger.info("✓ Databases initialized")
+            PRAGMA user_version = {_SCHEMA_VERSION};
+            COMMIT;
+        ''')
     
     def create_shortcuts(self):
         """Create desktop shortcuts"""
@@ -317,10 +690,17 @@ Categories=Development;
         
         desktop_file = Path.home() / '.local' / 'share' / 'applications' / 'automotive-debugger.desktop'
         desktop_file.parent.mkdir(parents=True, exist_ok=True)
-        desktop_file.write_text(desktop_entry)
         
-        # Make it executable
-        os.chmod(desktop_file, 0o755)
+        # Created executable in one step, then swapped in atomically so a
+        # re-run never leaves a half-written or non-executable entry
+        tmp_file = desktop_file.with_suffix('.tmp')
+        tmp_file.unlink(missing_ok=True)
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o755)
+        try:
+            os.write(fd, desktop_entry.encode())
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, desktop_file)
         
         logger.info("✓ Desktop entry created")
     
@@ -329,15 +709,20 @@ Categories=Development;
         logger.info("Verifying installation...")
         
         checks = {
-            'Node.js': shutil.which('node') is not None,
-            'npm': shutil.which('npm') is not None,
-            'Python': sys.version_info >= (3, 12),
-            'Ollama': shutil.which('ollama') is not None,
-            'Database': (self.base_dir / 'database' / 'app.db').exists()
+            'Node.js': lambda: _which('node') is not None,
+            'npm': lambda: _which('npm') is not None,
+            'Python': lambda: sys.version_info >= (3, 12),
+            'Ollama': lambda: _which('ollama') is not None,
+            'Database': lambda: (self.base_dir / 'database' / 'app.db').exists()
         }
         
+        # The checks are independent reads (PATH scans, file stats): run
+        # them concurrently, reporting in the order above
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            results = dict(zip(checks, executor.map(lambda check: check(), checks.values())))
+        
         all_good = True
-        for component, status in checks.items():
+        for component, status in results.items():
             if status:
                 logger.info(f"✓ {component}: OK")
             else:
@@ -355,7 +740,7 @@ Categories=Development;
         installer_path = self.base_dir / "python_installer.exe"
         
         logger.info("Downloading Python 3.12...")
-        urllib.request.urlretrieve(python_url, installer_path)
+        self._cached_download(python_url, installer_path)
         
         logger.info("Installing Python 3.12...")
         subprocess.run([
@@ -370,21 +755,31 @@ Categories=Development;
     
     def download_and_install_node_windows(self):
         """Download and install Node.js on Windows"""
-        node_url = "https://nodejs.org/dist/v20.10.0/node-v20.10.0-x64.msi"
+        node_dist = "https://nodejs.org/dist/v20.10.0"
+        node_file = "node-v20.10.0-x64.msi"
+        node_url = f"{node_dist}/{node_file}"
         installer_path = self.base_dir / "node_installer.msi"
         
         logger.info("Downloading Node.js...")
-        urllib.request.urlretrieve(node_url, installer_path)
+        # Verified against the checksums Node.js publishes with each release
+        node_sha256 = self._published_sha256(f"{node_dist}/SHASUMS256.txt", node_file)
+        self._cached_download(node_url, installer_path, sha256=node_sha256)
         
         logger.info("Installing Node.js...")
-        subprocess.run(['msiexec', '/i', str(installer_path), '/quiet'], check=True)
+        with self._installer_lock:
+            subprocess.run(['msiexec', '/i', str(installer_path), '/quiet'], check=True)
         
         installer_path.unlink()
         logger.info("✓ Node.js installed")
 
 def main():
     """Main entry point"""
-    installer = AutoDebuggerInstaller()
+    parser = argparse.ArgumentParser(description="Install Automotive Debug Log Analyzer")
+    parser.add_argument('--force', action='store_true',
+                        help="reinstall dependencies even if they are unchanged since the last install")
+    args = parser.parse_args()
+    
+    installer = AutoDebuggerInstaller(force=args.force)
     installer.run()
 
 if __name__ == "__main__":